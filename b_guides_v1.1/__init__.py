@@ -13,6 +13,8 @@ bl_info = {
     "category": "3D View, Camera, Sequencer",
 }
 
+import importlib
+
 import bpy
 from bpy.app.handlers import persistent
 
@@ -21,8 +23,6 @@ from . import properties
 from . import operators
 from . import presets
 from . import ui
-from . import drawing
-from . import camera_drawing
 
 # Store draw handlers
 _draw_handlers = {
@@ -30,127 +30,83 @@ _draw_handlers = {
     'view3d': None,
 }
 
+# Where each draw handler is installed: (space type, region type, module,
+# draw function). The drawing modules (and gpu) are only imported once a
+# guide is first enabled.
+_HANDLER_SPECS = {
+    'vse_view': (bpy.types.SpaceSequenceEditor, 'PREVIEW', ".drawing", "draw_guides_view"),
+    'view3d': (bpy.types.SpaceView3D, 'WINDOW', ".camera_drawing", "draw_camera_guides"),
+}
+
 
 def _any_vse_guide_active(settings):
     """Check if any VSE guide is enabled."""
     if settings is None:
         return False
-    return any([
-        settings.show_thirds,
-        settings.show_golden,
-        settings.show_center,
-        settings.show_diagonals,
-        settings.show_rulers,
-        settings.show_grid,
-        settings.show_custom_guides,
-        settings.show_golden_spiral,
-        settings.show_golden_triangle,
-        settings.show_circular_thirds,
-        settings.show_radial_symmetry,
-        settings.show_vanishing_point,
-        settings.show_diagonal_reciprocals,
-        settings.show_harmony_triangles,
-        settings.show_diagonal_method,
-    ])
+    # Cached per settings group and refreshed when a toggle changes
+    return bool(properties.get_enabled_guides(settings))
 
 
 def _any_camera_guide_active(camera):
     """Check if any camera guide is enabled for the given camera."""
-    if camera is None or not hasattr(camera.data, 'camera_guides'):
+    # Every Camera datablock has guide settings while the addon is registered
+    if camera is None or camera.type != 'CAMERA':
         return False
-    settings = camera.data.camera_guides
-    return _any_vse_guide_active(settings)
+    return _any_vse_guide_active(camera.data.camera_guides)
 
 
-def register_vse_handler():
-    """Register VSE draw handler if not already registered."""
-    global _draw_handlers
-    if _draw_handlers['vse_view'] is None:
+def set_draw_handler(kind, enabled):
+    """Add or remove the draw handler of the given kind ('vse_view' or 'view3d')."""
+    space_type, region_type, module_name, func_name = _HANDLER_SPECS[kind]
+    handler = _draw_handlers[kind]
+    if enabled and handler is None:
         try:
-            _draw_handlers['vse_view'] = bpy.types.SpaceSequenceEditor.draw_handler_add(
-                drawing.draw_guides_view, (), 'PREVIEW', 'POST_VIEW'
-            )
+            draw_func = getattr(importlib.import_module(module_name, __name__), func_name)
+            _draw_handlers[kind] = space_type.draw_handler_add(draw_func, (), region_type, 'POST_VIEW')
         except Exception as e:
-            print(f"B Guides: Failed to register VSE handler: {e}")
-
-
-def unregister_vse_handler():
-    """Unregister VSE draw handler if registered."""
-    global _draw_handlers
-    if _draw_handlers['vse_view'] is not None:
-        try:
-            bpy.types.SpaceSequenceEditor.draw_handler_remove(_draw_handlers['vse_view'], 'PREVIEW')
-        except Exception:
-            pass
-        _draw_handlers['vse_view'] = None
-
-
-def register_3d_handler():
-    """Register 3D Viewport draw handler if not already registered."""
-    global _draw_handlers
-    if _draw_handlers['view3d'] is None:
-        try:
-            _draw_handlers['view3d'] = bpy.types.SpaceView3D.draw_handler_add(
-                camera_drawing.draw_camera_guides, (), 'WINDOW', 'POST_VIEW'
-            )
-        except Exception as e:
-            print(f"B Guides: Failed to register 3D handler: {e}")
-
-
-def unregister_3d_handler():
-    """Unregister 3D Viewport draw handler if registered."""
-    global _draw_handlers
-    if _draw_handlers['view3d'] is not None:
+            print(f"B Guides: Failed to register {kind} handler: {e}")
+    elif not enabled and handler is not None:
         try:
-            bpy.types.SpaceView3D.draw_handler_remove(_draw_handlers['view3d'], 'WINDOW')
+            space_type.draw_handler_remove(handler, region_type)
         except Exception:
             pass
-        _draw_handlers['view3d'] = None
+        _draw_handlers[kind] = None
 
 
 def update_vse_handler_state():
     """Register or unregister VSE handler based on current settings."""
-    try:
-        scene = bpy.context.scene
-        if scene and hasattr(scene, 'vse_guides'):
-            if _any_vse_guide_active(scene.vse_guides):
-                register_vse_handler()
-            else:
-                unregister_vse_handler()
-    except Exception:
-        pass
+    scene = bpy.context.scene
+    if scene is not None:
+        set_draw_handler('vse_view', _any_vse_guide_active(scene.vse_guides))
 
 
 def update_3d_handler_state():
     """Register or unregister 3D handler based on current camera settings."""
-    try:
-        scene = bpy.context.scene
-        if scene and scene.camera:
-            if _any_camera_guide_active(scene.camera):
-                register_3d_handler()
-            else:
-                unregister_3d_handler()
-    except Exception:
-        pass
+    scene = bpy.context.scene
+    if scene is not None and scene.camera:
+        set_draw_handler('view3d', _any_camera_guide_active(scene.camera))
 
 
 @persistent
 def load_handler(dummy):
     """Handler to set up draw handlers after file load if guides were enabled."""
-    # Check VSE guides
-    try:
-        for scene in bpy.data.scenes:
-            if hasattr(scene, 'vse_guides') and _any_vse_guide_active(scene.vse_guides):
-                register_vse_handler()
-                break
-    except Exception:
-        pass
+    # Message bus subscriptions and settings from the previous file are gone
+    properties.invalidate_enabled_guides()
+    properties.mark_settings_changed()
+    properties.subscribe_msgbus()
     
-    # Check camera guides
+    # Register the draw handlers needed by any scene in one pass, stopping
+    # once both are in place
+    need_vse = need_3d = True
     try:
-        for camera in bpy.data.cameras:
-            if hasattr(camera, 'camera_guides') and _any_vse_guide_active(camera.camera_guides):
-                register_3d_handler()
+        for scene in bpy.data.scenes:
+            if need_vse and _any_vse_guide_active(scene.vse_guides):
+                set_draw_handler('vse_view', True)
+                need_vse = False
+            if need_3d and _any_camera_guide_active(scene.camera):
+                set_draw_handler('view3d', True)
+                need_3d = False
+            if not (need_vse or need_3d):
                 break
     except Exception:
         pass
@@ -170,7 +126,9 @@ def register():
     # Don't register draw handlers here - they'll be registered on demand
     # when user enables guides or when a file with enabled guides is loaded
     
-    print("B Guides addon registered")
+    # Only reported when Blender runs with --debug-python
+    if bpy.app.debug_python:
+        print("B Guides addon registered")
 
 
 def unregister():
@@ -180,8 +138,8 @@ def unregister():
         bpy.app.handlers.load_post.remove(load_handler)
     
     # Remove all draw handlers
-    unregister_vse_handler()
-    unregister_3d_handler()
+    set_draw_handler('vse_view', False)
+    set_draw_handler('view3d', False)
     
     # Unregister submodules (in reverse order)
     ui.unregister()
@@ -189,7 +147,9 @@ def unregister():
     operators.unregister()
     properties.unregister()
     
-    print("B Guides addon unregistered")
+    # Only reported when Blender runs with --debug-python
+    if bpy.app.debug_python:
+        print("B Guides addon unregistered")
 
 
 if __name__ == "__main__":
@@ -7,6 +7,8 @@ from gpu_extras.batch import batch_for_shader
 from mathutils import Vector, Matrix
 from bpy_extras import view3d_utils
 
+from .properties import get_enabled_guides
+
 
 def get_camera_frame_coordinates(context, region, region_data):
     """
@@ -68,33 +70,15 @@ def draw_camera_guides():
         scene = context.scene
         camera = scene.camera
         
-        if not camera or not camera.data:
-            return
-        
-        # Check if camera has guide settings
-        if not hasattr(camera.data, 'camera_guides'):
+        # Only camera objects carry guide settings
+        if not camera or camera.type != 'CAMERA':
             return
         
         settings = camera.data.camera_guides
         
         # Check if any guides need to be drawn
-        if not any([
-            settings.show_thirds,
-            settings.show_golden,
-            settings.show_center,
-            settings.show_diagonals,
-            settings.show_grid,
-            settings.show_custom_guides,
-            settings.show_golden_spiral,
-            settings.show_golden_triangle,
-            settings.show_circular_thirds,
-            settings.show_radial_symmetry,
-            settings.show_vanishing_point,
-            settings.show_diagonal_reciprocals,
-            settings.show_harmony_triangles,
-            settings.show_diagonal_method,
-            settings.show_rulers
-        ]):
+        enabled_guides = get_enabled_guides(settings)
+        if not enabled_guides:
             return
         
         # Get current area and space
@@ -155,12 +139,7 @@ def draw_camera_guides():
                 drawing.draw_grid(settings, frame_x, frame_y, frame_width, frame_height)
             
             # Draw guides
-            if any([settings.show_thirds, settings.show_golden, settings.show_center, 
-                    settings.show_diagonals, settings.show_golden_spiral, 
-                    settings.show_golden_triangle, settings.show_circular_thirds,
-                    settings.show_radial_symmetry, settings.show_vanishing_point,
-                    settings.show_diagonal_reciprocals, settings.show_harmony_triangles,
-                    settings.show_diagonal_method]):
+            if not drawing.OVERLAY_TOGGLES.issuperset(enabled_guides):
                 drawing.draw_composition_guides(settings, frame_x, frame_y, frame_width, frame_height)
             
             # Draw custom guides
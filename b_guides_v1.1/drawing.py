@@ -7,6 +7,11 @@ import math
 from gpu_extras.batch import batch_for_shader
 from mathutils import Vector, Matrix
 
+from .properties import get_enabled_guides, get_generation
+
+# Toggles drawn by their own functions rather than draw_composition_guides
+OVERLAY_TOGGLES = frozenset({"show_rulers", "show_grid", "show_custom_guides"})
+
 
 def get_frame_coordinates(context: bpy.types.Context, region: bpy.types.Region) -> tuple[float, float, float, float]:
     """
@@ -133,23 +138,8 @@ def draw_guides_view():
         settings = context.scene.vse_guides
         
         # Check if any guides need to be drawn
-        if not any([
-            settings.show_thirds,
-            settings.show_golden,
-            settings.show_center,
-            settings.show_diagonals,
-            settings.show_grid,
-            settings.show_custom_guides,
-            settings.show_golden_spiral,
-            settings.show_golden_triangle,
-            settings.show_circular_thirds,
-            settings.show_radial_symmetry,
-            settings.show_vanishing_point,
-            settings.show_diagonal_reciprocals,
-            settings.show_harmony_triangles,
-            settings.show_diagonal_method,
-            settings.show_rulers
-        ]):
+        enabled_guides = get_enabled_guides(settings)
+        if not enabled_guides:
             return
         
         # Get current area and space
@@ -200,12 +190,7 @@ def draw_guides_view():
                 draw_grid(settings, frame_x, frame_y, frame_width, frame_height)
             
             # Draw guides
-            if any([settings.show_thirds, settings.show_golden, settings.show_center, 
-                    settings.show_diagonals, settings.show_golden_spiral, 
-                    settings.show_golden_triangle, settings.show_circular_thirds,
-                    settings.show_radial_symmetry, settings.show_vanishing_point,
-                    settings.show_diagonal_reciprocals, settings.show_harmony_triangles,
-                    settings.show_diagonal_method]):
+            if not OVERLAY_TOGGLES.issuperset(enabled_guides):
                 draw_composition_guides(settings, frame_x, frame_y, frame_width, frame_height)
             
             # Draw custom guides
@@ -345,9 +330,7 @@ def draw_grid(settings: bpy.types.PropertyGroup, frame_x: float, frame_y: float,
     if lines:
         batch = batch_for_shader(shader, 'LINES', {"pos": lines})
         shader.bind()
-        grid_color = (settings.grid_color[0], settings.grid_color[1], 
-                     settings.grid_color[2], settings.grid_color[3])
-        shader.uniform_float("color", grid_color)
+        shader.uniform_float("color", tuple(settings.grid_color))
         batch.draw(shader)
     
     gpu.state.line_width_set(1.0)
@@ -379,10 +362,24 @@ def draw_custom_guides(context: bpy.types.Context, settings: bpy.types.PropertyG
     # Pre-calculate max length needed
     max_length = max(frame_width, frame_height) * 3
     
-    for guide in custom_guides_list:
+    clip_to_frame = settings.hide_guides_outside_frame
+    
+    # Fetch the float fields of all guides in bulk rather than through
+    # several RNA lookups per guide
+    count = len(custom_guides_list)
+    position_x = [0.0] * count
+    position_y = [0.0] * count
+    rotation = [0.0] * count
+    colors = [0.0] * (count * 4)
+    custom_guides_list.foreach_get("position_x", position_x)
+    custom_guides_list.foreach_get("position_y", position_y)
+    custom_guides_list.foreach_get("rotation", rotation)
+    custom_guides_list.foreach_get("color", colors)
+    
+    for i, guide in enumerate(custom_guides_list):
         # Calculate pivot point in screen space
-        pivot_x = center_x + (guide.position_x * frame_width / 2)
-        pivot_y = center_y + (guide.position_y * frame_height / 2)
+        pivot_x = center_x + (position_x[i] * frame_width / 2)
+        pivot_y = center_y + (position_y[i] * frame_height / 2)
         
         # Base rotation from orientation
         base_angle = 0
@@ -390,7 +387,7 @@ def draw_custom_guides(context: bpy.types.Context, settings: bpy.types.PropertyG
             base_angle = math.radians(90)
             
         # Total rotation
-        total_angle = base_angle + guide.rotation
+        total_angle = base_angle + rotation[i]
         
         # Calculate endpoints based on angle
         dx = max_length * math.cos(total_angle)
@@ -401,7 +398,7 @@ def draw_custom_guides(context: bpy.types.Context, settings: bpy.types.PropertyG
         
         # Clip to frame boundaries if enabled
         final_line = None
-        if settings.hide_guides_outside_frame:
+        if clip_to_frame:
             clipped = clip_line_to_rect(
                 p1, p2,
                 frame_x, frame_y, frame_width, frame_height
@@ -413,10 +410,11 @@ def draw_custom_guides(context: bpy.types.Context, settings: bpy.types.PropertyG
             
         if final_line:
             # Convert color to tuple for dictionary key
-            color_key = tuple(guide.color)
+            color_key = tuple(colors[i * 4:i * 4 + 4])
             if color_key not in lines_by_color:
                 lines_by_color[color_key] = []
-            lines_by_color[color_key].append(final_line)
+            # Store endpoints flat so the list can be handed to the batch as-is
+            lines_by_color[color_key].extend(final_line)
     
     # Draw batches
     if lines_by_color:
@@ -425,38 +423,78 @@ def draw_custom_guides(context: bpy.types.Context, settings: bpy.types.PropertyG
         gpu.state.line_width_set(1.5)
         shader.bind()
         
-        for color, lines in lines_by_color.items():
-            vertices = []
-            for p1, p2 in lines:
-                vertices.append(p1)
-                vertices.append(p2)
-            
-            if vertices:
-                batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-                shader.uniform_float("color", color)
-                batch.draw(shader)
+        for color, vertices in lines_by_color.items():
+            batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
+            shader.uniform_float("color", color)
+            batch.draw(shader)
     
     gpu.state.line_width_set(1.0)
     gpu.state.blend_set('NONE')
 
 
+# Composition guide batches baked for the current settings generation,
+# keyed by (owner session_uid, frame rect)
+_composition_cache = {}
+_composition_generation = None
+
+# Frame rects kept per generation (several areas may show the same settings)
+_COMPOSITION_CACHE_SIZE = 8
+
+
 def draw_composition_guides(settings: bpy.types.PropertyGroup, frame_x: float, frame_y: float, 
                             frame_width: float, frame_height: float) -> None:
     """Draw the composition guide lines inside frame coordinates"""
+    global _composition_generation
     
-    # Prepare shader
     shader = gpu.shader.from_builtin('UNIFORM_COLOR')
+    
+    # Geometry only depends on the settings and the frame, so rebuild it
+    # only when either changed since the last draw
+    generation = get_generation()
+    if generation != _composition_generation:
+        _composition_cache.clear()
+        _composition_generation = generation
+    
+    key = (settings.id_data.session_uid, frame_x, frame_y, frame_width, frame_height)
+    batches = _composition_cache.get(key)
+    if batches is None:
+        batches = build_composition_batches(shader, settings, frame_x, frame_y, frame_width, frame_height)
+        if len(_composition_cache) >= _COMPOSITION_CACHE_SIZE:
+            _composition_cache.clear()
+        _composition_cache[key] = batches
+    
+    if not batches:
+        return
+    
     gpu.state.blend_set('ALPHA')
     gpu.state.line_width_set(settings.line_width)
+    shader.bind()
+    for batch, color in batches:
+        shader.uniform_float("color", color)
+        batch.draw(shader)
     
-    # Helper to draw a batch of lines with a specific color
+    gpu.state.line_width_set(1.0)
+    gpu.state.blend_set('NONE')
+
+
+def build_composition_batches(shader: gpu.types.GPUShader, settings: bpy.types.PropertyGroup,
+                              frame_x: float, frame_y: float,
+                              frame_width: float, frame_height: float) -> list:
+    """Build (batch, color) pairs for the enabled composition guides"""
+    
+    batches = []
+    
+    # Read the clipping flag once instead of per line
+    clip_to_frame = settings.hide_guides_outside_frame
+    
+    # Helper to bake a batch of lines with a specific color
     def draw_lines(lines, color):
         if not lines:
             return
         vertices = []
         for line_start, line_end in lines:
             # Clip lines to frame boundaries if enabled
-            if settings.hide_guides_outside_frame:
+            if clip_to_frame:
                 # Clip line to frame boundaries
                 clipped = clip_line_to_rect(
                     line_start, line_end,
@@ -472,10 +510,7 @@ def draw_composition_guides(settings: bpy.types.PropertyGroup, frame_x: float, f
         if not vertices:
             return
             
-        batch = batch_for_shader(shader, 'LINES', {"pos": vertices})
-        shader.bind()
-        shader.uniform_float("color", color)
-        batch.draw(shader)
+        batches.append((batch_for_shader(shader, 'LINES', {"pos": vertices}), tuple(color)))
 
     # Rule of thirds
     if settings.show_thirds:
@@ -593,8 +628,10 @@ def draw_composition_guides(settings: bpy.types.PropertyGroup, frame_x: float, f
         lx, ly = 0.0, 0.0
         lw, lh = gen_w, gen_h
         
-        # Limit iterations
-        max_iter = settings.golden_spiral_length
+        # Limit iterations: each quarter turn shrinks the box by phi, so past
+        # log_phi(gen_h) iterations the remaining box is under a pixel anyway
+        max_iter = min(settings.golden_spiral_length,
+                       int(math.log(gen_h) / math.log(phi)) + 2)
         
         for idx in range(max_iter):
             if lw < 1.0 or lh < 1.0:
@@ -767,7 +804,7 @@ def draw_composition_guides(settings: bpy.types.PropertyGroup, frame_x: float, f
         lines = []
         center_x = frame_x + frame_width / 2
         center_y = frame_y + frame_height / 2
-        max_radius = math.sqrt((frame_width / 2) ** 2 + (frame_height / 2) ** 2)
+        max_radius = 0.5 * math.hypot(frame_width, frame_height)
         
         for i in range(settings.radial_line_count):
             angle = (2 * math.pi * i) / settings.radial_line_count
@@ -1002,8 +1039,7 @@ def draw_composition_guides(settings: bpy.types.PropertyGroup, frame_x: float, f
         
         draw_lines(lines, settings.diagonal_method_color)
     
-    gpu.state.line_width_set(1.0)
-    gpu.state.blend_set('NONE')
+    return batches
 
 
 def format_unit_value(value, unit_type):
@@ -1061,10 +1097,10 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
     
     # Corner box (slightly darker than ruler background)
     corner_bg_color = (
-        settings.bg_color[0] * 0.7,
-        settings.bg_color[1] * 0.7,
-        settings.bg_color[2] * 0.7,
-        min(1.0, settings.bg_color[3] * 1.1)
+        bg_color[0] * 0.7,
+        bg_color[1] * 0.7,
+        bg_color[2] * 0.7,
+        min(1.0, bg_color[3] * 1.1)
     )
     corner_verts = [
         Vector((frame_x - ruler_size - gap, frame_y + frame_height + gap, 0)),
@@ -1106,7 +1142,13 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
     # Setup text with better readability and anti-aliasing
     font_id = 0
     blf.size(font_id, 10)
-    blf.color(font_id, *settings.ruler_color)
+    # Read the ruler color once and derive the tick shades from it
+    ruler_color = tuple(settings.ruler_color)
+    medium_color = (ruler_color[0] * 0.7, ruler_color[1] * 0.7,
+                    ruler_color[2] * 0.7, ruler_color[3] * 0.75)
+    minor_color = (ruler_color[0] * 0.5, ruler_color[1] * 0.5,
+                   ruler_color[2] * 0.5, ruler_color[3] * 0.6)
+    blf.color(font_id, *ruler_color)
     
     # Enable shadow for depth
     blf.enable(font_id, blf.SHADOW)
@@ -1226,13 +1268,11 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
         gpu.state.line_width_set(2.0)
         batch = batch_for_shader(shader, 'LINES', {"pos": major_ticks})
         shader.bind()
-        shader.uniform_float("color", settings.ruler_color)
+        shader.uniform_float("color", ruler_color)
         batch.draw(shader)
     
     if medium_ticks:
         gpu.state.line_width_set(1.5)
-        medium_color = (settings.ruler_color[0] * 0.7, settings.ruler_color[1] * 0.7, 
-                       settings.ruler_color[2] * 0.7, settings.ruler_color[3] * 0.75)
         batch = batch_for_shader(shader, 'LINES', {"pos": medium_ticks})
         shader.bind()
         shader.uniform_float("color", medium_color)
@@ -1240,8 +1280,6 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
     
     if minor_ticks:
         gpu.state.line_width_set(1.0)
-        minor_color = (settings.ruler_color[0] * 0.5, settings.ruler_color[1] * 0.5, 
-                      settings.ruler_color[2] * 0.5, settings.ruler_color[3] * 0.6)
         batch = batch_for_shader(shader, 'LINES', {"pos": minor_ticks})
         shader.bind()
         shader.uniform_float("color", minor_color)
@@ -1274,7 +1312,7 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
     ]
     batch = batch_for_shader(shader, 'LINES', {"pos": tick_verts_end})
     shader.bind()
-    shader.uniform_float("color", settings.ruler_color)
+    shader.uniform_float("color", ruler_color)
     batch.draw(shader)
     
     # Draw end label
@@ -1359,13 +1397,11 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
         gpu.state.line_width_set(2.0)
         batch = batch_for_shader(shader, 'LINES', {"pos": v_major_ticks})
         shader.bind()
-        shader.uniform_float("color", settings.ruler_color)
+        shader.uniform_float("color", ruler_color)
         batch.draw(shader)
     
     if v_medium_ticks:
         gpu.state.line_width_set(1.5)
-        medium_color = (settings.ruler_color[0] * 0.7, settings.ruler_color[1] * 0.7, 
-                       settings.ruler_color[2] * 0.7, settings.ruler_color[3] * 0.75)
         batch = batch_for_shader(shader, 'LINES', {"pos": v_medium_ticks})
         shader.bind()
         shader.uniform_float("color", medium_color)
@@ -1373,8 +1409,6 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
     
     if v_minor_ticks:
         gpu.state.line_width_set(1.0)
-        minor_color = (settings.ruler_color[0] * 0.5, settings.ruler_color[1] * 0.5, 
-                      settings.ruler_color[2] * 0.5, settings.ruler_color[3] * 0.6)
         batch = batch_for_shader(shader, 'LINES', {"pos": v_minor_ticks})
         shader.bind()
         shader.uniform_float("color", minor_color)
@@ -1409,7 +1443,7 @@ def draw_rulers_base(context, settings, frame_x, frame_y, frame_width, frame_hei
     ]
     batch = batch_for_shader(shader, 'LINES', {"pos": tick_verts_end})
     shader.bind()
-    shader.uniform_float("color", settings.ruler_color)
+    shader.uniform_float("color", ruler_color)
     batch.draw(shader)
     
     # Draw end label
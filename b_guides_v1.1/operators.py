@@ -4,14 +4,25 @@ import bpy
 from bpy.types import Operator
 from bpy.props import IntProperty, EnumProperty
 
-from .properties import update_all_areas, update_vse_areas, update_3d_areas
+from .properties import (
+    GUIDE_TOGGLES,
+    ORIENTATION_ITEMS,
+    update_all_areas,
+    update_vse_areas,
+    update_3d_areas,
+    batch_updates,
+    get_enabled_guides,
+)
+
+# For validating the guide names saved by VSE_OT_toggle_all_guides
+GUIDE_TOGGLE_SET = frozenset(GUIDE_TOGGLES)
 
 
 def get_settings_for_context(context):
     """Get the appropriate settings and custom guides based on context"""
     if context.area and context.area.type == 'VIEW_3D':
         camera = context.scene.camera
-        if camera and hasattr(camera.data, 'camera_guides'):
+        if camera and camera.type == 'CAMERA':
             return camera.data.camera_guides, camera.data.custom_camera_guides, update_3d_areas
     
     # Default to VSE
@@ -25,7 +36,7 @@ class VSE_OT_add_custom_guide(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     orientation: EnumProperty(
-        items=[('HORIZONTAL', "Horizontal", ""), ('VERTICAL', "Vertical", "")],
+        items=ORIENTATION_ITEMS,
         default='VERTICAL'
     )
     
@@ -99,15 +110,25 @@ class VSE_OT_move_guide_up(Operator):
     bl_label = "Move Guide Line Up"
     bl_options = {'REGISTER', 'UNDO'}
     
+    count: IntProperty(
+        name="Count",
+        description="Number of positions to move",
+        default=1,
+        min=1
+    )
+    
     def execute(self, context: bpy.types.Context) -> set[str]:
         settings, custom_guides, update_func = get_settings_for_context(context)
         index = settings.active_guide_index
+        target = max(index - self.count, 0)
         
-        if index > 0:
-            custom_guides.move(index, index - 1)
-            settings.active_guide_index = index - 1
-            update_func()
+        # Already at the top (or out of range): don't push an undo step
+        if index >= len(custom_guides) or target >= index:
+            return {'CANCELLED'}
         
+        custom_guides.move(index, target)
+        settings.active_guide_index = target
+        update_func()
         return {'FINISHED'}
 
 
@@ -117,15 +138,25 @@ class VSE_OT_move_guide_down(Operator):
     bl_label = "Move Guide Line Down"
     bl_options = {'REGISTER', 'UNDO'}
     
+    count: IntProperty(
+        name="Count",
+        description="Number of positions to move",
+        default=1,
+        min=1
+    )
+    
     def execute(self, context: bpy.types.Context) -> set[str]:
         settings, custom_guides, update_func = get_settings_for_context(context)
         index = settings.active_guide_index
+        target = min(index + self.count, len(custom_guides) - 1)
         
-        if index < len(custom_guides) - 1:
-            custom_guides.move(index, index + 1)
-            settings.active_guide_index = index + 1
-            update_func()
+        # Already at the bottom (or out of range): don't push an undo step
+        if index < 0 or target <= index:
+            return {'CANCELLED'}
         
+        custom_guides.move(index, target)
+        settings.active_guide_index = target
+        update_func()
         return {'FINISHED'}
 
 
@@ -136,35 +167,22 @@ class VSE_OT_reset_guides(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context: bpy.types.Context) -> set[str]:
-        settings, custom_guides, update_func = get_settings_for_context(context)
-        
-        # Reset all properties to defaults
-        settings.show_thirds = False
-        settings.show_golden = False
-        settings.show_center = False
-        settings.show_diagonals = False
-        settings.show_rulers = False
-        settings.show_grid = False
-        settings.show_custom_guides = True
-        
-        # Reset newer guides
-        settings.show_golden_spiral = False
-        settings.show_golden_triangle = False
-        settings.show_circular_thirds = False
-        settings.show_radial_symmetry = False
-        settings.show_vanishing_point = False
-        settings.show_diagonal_reciprocals = False
-        settings.show_harmony_triangles = False
-        settings.show_diagonal_method = False
-        
-        settings.ruler_units = 'RESOLUTION'
-        settings.grid_divisions = 8
-        settings.grid_square = False
-        settings.ruler_color = (1.0, 1.0, 1.0, 0.8)
-        settings.line_width = 1.0
-        settings.ruler_size = 30
+        # batch_updates() redraws on exit, so the update function isn't needed
+        settings, _, _ = get_settings_for_context(context)
+        
+        # Reset all properties to defaults, redrawing once afterwards
+        with batch_updates():
+            # Only the guide lines stay enabled
+            for prop in GUIDE_TOGGLES:
+                setattr(settings, prop, prop == "show_custom_guides")
+            
+            settings.ruler_units = 'RESOLUTION'
+            settings.grid_divisions = 8
+            settings.grid_square = False
+            settings.ruler_color = (1.0, 1.0, 1.0, 0.8)
+            settings.line_width = 1.0
+            settings.ruler_size = 30
         
-        update_func()
         self.report({'INFO'}, "Guide settings reset to defaults")
         return {'FINISHED'}
 
@@ -176,69 +194,44 @@ class VSE_OT_toggle_all_guides(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context: bpy.types.Context) -> set[str]:
-        settings, custom_guides, update_func = get_settings_for_context(context)
-        
-        # List of all guide property names
-        guide_props = [
-            "show_thirds",
-            "show_golden",
-            "show_center",
-            "show_diagonals",
-            "show_rulers",
-            "show_grid",
-            "show_custom_guides",
-            "show_golden_spiral",
-            "show_golden_triangle",
-            "show_circular_thirds",
-            "show_radial_symmetry",
-            "show_vanishing_point",
-            "show_diagonal_reciprocals",
-            "show_harmony_triangles",
-            "show_diagonal_method"
-        ]
+        settings, _, _ = get_settings_for_context(context)
         
-        # Check if any guide is active
-        any_active = False
-        for prop in guide_props:
-            if getattr(settings, prop):
-                any_active = True
-                break
+        # Enabled guides (cached per settings group); empty means everything is off
+        active_guides = get_enabled_guides(settings)
         
-        if any_active:
-            # Toggling OFF: Save state and disable all
-            active_guides = []
-            for prop in guide_props:
-                if getattr(settings, prop):
-                    active_guides.append(prop)
+        # Apply all toggles first, then redraw and re-check handlers once
+        with batch_updates():
+            if active_guides:
+                # Toggling OFF: Save state and disable all
+                for prop in active_guides:
                     setattr(settings, prop, False)
             
-            # Store comma-separated list
-            settings.stored_active_guides = ",".join(active_guides)
-            self.report({'INFO'}, "Guides disabled")
+                # Store comma-separated list
+                settings.stored_active_guides = ",".join(active_guides)
+                self.report({'INFO'}, "Guides disabled")
             
-        else:
-            # Toggling ON: Restore state
-            if settings.stored_active_guides:
-                # Restore from saved state
-                saved_guides = settings.stored_active_guides.split(",")
-                count = 0
-                for prop in saved_guides:
-                    if hasattr(settings, prop):
-                        setattr(settings, prop, True)
-                        count += 1
+            else:
+                # Toggling ON: Restore state
+                if settings.stored_active_guides:
+                    # Restore from saved state
+                    saved_guides = settings.stored_active_guides.split(",")
+                    count = 0
+                    for prop in saved_guides:
+                        if prop in GUIDE_TOGGLE_SET:
+                            setattr(settings, prop, True)
+                            count += 1
                 
-                if count == 0:
-                    # Fallback if saved state was somehow empty or invalid
+                    if count == 0:
+                        # Fallback if saved state was somehow empty or invalid
+                        settings.show_thirds = True
+                        settings.show_custom_guides = True
+                else:
+                    # No saved state (first run), enable defaults
                     settings.show_thirds = True
                     settings.show_custom_guides = True
-            else:
-                # No saved state (first run), enable defaults
-                settings.show_thirds = True
-                settings.show_custom_guides = True
                 
-            self.report({'INFO'}, "Guides enabled")
+                self.report({'INFO'}, "Guides enabled")
         
-        update_func()
         return {'FINISHED'}
 
 
@@ -255,13 +248,4 @@ classes = (
     VSE_OT_toggle_all_guides,
 )
 
-
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-
-def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
@@ -1,10 +1,15 @@
 """Built-in preset support for Guides addon (Blender presets)."""
 
+import os
 import bpy
 from bl_operators.presets import AddPresetBase
 from bpy.types import Menu, Operator
 
-PRESET_VALUES = [
+from .properties import batch_updates
+
+# Paths written into saved presets. Each entry must stay in "settings.xxx"
+# form so it resolves against the settings binding in preset_defines.
+PRESET_VALUES = (
     "settings.show_thirds", "settings.show_golden", "settings.show_center",
     "settings.show_diagonals", "settings.show_golden_spiral", "settings.show_golden_triangle",
     "settings.show_radial_symmetry", "settings.show_vanishing_point", "settings.show_circular_thirds",
@@ -26,55 +31,162 @@ PRESET_VALUES = [
     "settings.ruler_units", "settings.line_width", "settings.ruler_size",
     "settings.grid_divisions", "settings.grid_square", "settings.hide_guides_outside_frame",
     "settings.custom_guides_data",
-]
+)
+
+
+PRESET_SUBDIR = "b_guides"
+
+# Preset search paths, resolved once at register()
+_preset_paths = ()
+
+# Preset names per directory, keyed by path: (mtime, names)
+_preset_cache = {}
+
+# Last merged result: (mtimes of all search paths, sorted names)
+_preset_list = (None, ())
+
+# Preset file per name for the last merged result; the first search path wins
+_preset_files = {}
+
+# Compiled preset scripts, keyed by path: ((mtime, size), code)
+_preset_code_cache = {}
+
+
+def get_preset_paths():
+    """Return the preset search paths resolved at register time."""
+    return _preset_paths
+
+
+def list_presets():
+    """Return sorted preset names, rescanning a directory only when its mtime changes.
+    
+    The same tuple is returned until a preset directory changes, so callers
+    can hold on to it between redraws.
+    """
+    global _preset_list, _preset_files
+    
+    mtimes = []
+    for preset_path in get_preset_paths():
+        try:
+            mtimes.append((preset_path, os.stat(preset_path).st_mtime_ns))
+        except OSError:
+            continue
+    mtimes = tuple(mtimes)
+    
+    if _preset_list[0] == mtimes:
+        return _preset_list[1]
+    
+    files = {}
+    for preset_path, mtime in mtimes:
+        cached = _preset_cache.get(preset_path)
+        if cached is None or cached[0] != mtime:
+            with os.scandir(preset_path) as entries:
+                cached = (mtime, tuple(
+                    entry.name[:-3]
+                    for entry in entries if entry.name.endswith('.py')
+                ))
+            _preset_cache[preset_path] = cached
+        for name in cached[1]:
+            files.setdefault(name, os.path.join(preset_path, name + ".py"))
+    
+    _preset_files = files
+    _preset_list = (mtimes, tuple(sorted(files)))
+    return _preset_list[1]
+
+
+def get_preset_file(preset_name):
+    """Return the file of the named preset, or None if there is no such preset."""
+    list_presets()
+    return _preset_files.get(preset_name)
+
+
+# Presets listed directly in the menu; the rest go into a submenu, which
+# Blender only draws when it is opened
+MENU_PRESET_LIMIT = 50
+
+
+def invalidate_preset_cache():
+    """Force the next list_presets() call to rescan preset directories and recompile presets."""
+    global _preset_list, _preset_files
+    _preset_cache.clear()
+    _preset_code_cache.clear()
+    _preset_list = (None, ())
+    _preset_files = {}
+
+
+def get_active_preset(context):
+    """Return the active preset name of the VSE or camera settings."""
+    is_vse = context.area and context.area.type == 'SEQUENCE_EDITOR'
+    if is_vse:
+        settings = context.scene.vse_guides
+    else:
+        cam = getattr(context.scene, 'camera', None)
+        settings = cam.data.camera_guides if cam and cam.type == 'CAMERA' else None
+    
+    if settings:
+        return settings.active_preset
+    return ""
+
+
+def draw_preset_items(layout, preset_operator, preset_names, active_preset):
+    """Draw one operator row per preset, marking the active one."""
+    for preset_name in preset_names:
+        props = layout.operator(
+            preset_operator,
+            text=preset_name,
+            icon='RIGHTARROW_THIN' if preset_name == active_preset else 'NONE'
+        )
+        props.preset_name = preset_name
+
+
+def get_preset_code(filepath, stamp):
+    """Return the compiled preset script, recompiling only when its (mtime, size) stamp changed.
+    
+    The size guards against a rewrite within the filesystem's timestamp
+    granularity.
+    """
+    cached = _preset_code_cache.get(filepath)
+    if cached is None or cached[0] != stamp:
+        # Read raw bytes in one call; compile() handles the source decoding
+        with open(filepath, 'rb') as file:
+            cached = (stamp, compile(file.read(), filepath, 'exec'))
+        _preset_code_cache[filepath] = cached
+    return cached[1]
 
 
 class B_GUIDES_MT_presets(Menu):
     bl_label = "Guide Presets"
-    preset_subdir = "b_guides"
+    preset_subdir = PRESET_SUBDIR
     preset_operator = "b_guides.execute_preset"  # Use custom operator
     
     def draw(self, context):
         """Custom draw to display active preset name"""
-        import os
-        
-        # Get the settings (VSE or Camera)
-        is_vse = context.area and context.area.type == 'SEQUENCE_EDITOR'
-        if is_vse:
-            settings = context.scene.vse_guides
-        else:
-            cam = getattr(context.scene, 'camera', None)
-            settings = cam.data.camera_guides if cam and hasattr(cam.data, 'camera_guides') else None
-        
-        # Get active preset name if available
-        active_preset = ""
-        if settings and hasattr(settings, 'active_preset'):
-            active_preset = settings.active_preset
-        
         # Get list of available presets
-        preset_paths = bpy.utils.preset_paths(self.preset_subdir)
-        preset_files = []
-        for preset_path in preset_paths:
-            if os.path.isdir(preset_path):
-                for fn in os.listdir(preset_path):
-                    if fn.endswith('.py'):
-                        preset_files.append(os.path.splitext(fn)[0])
+        preset_files = list_presets()
         
         layout = self.layout
         
         # Display presets
         if preset_files:
-            for preset_name in sorted(preset_files):
-                props = layout.operator(
-                    self.preset_operator,
-                    text=preset_name,
-                    icon='RIGHTARROW_THIN' if preset_name == active_preset else 'NONE'
-                )
-                props.preset_name = preset_name
+            draw_preset_items(layout, self.preset_operator,
+                              preset_files[:MENU_PRESET_LIMIT], get_active_preset(context))
+            if len(preset_files) > MENU_PRESET_LIMIT:
+                layout.separator()
+                layout.menu("B_GUIDES_MT_presets_more", text="More...")
         else:
             layout.label(text="No Presets", icon='INFO')
 
 
+class B_GUIDES_MT_presets_more(Menu):
+    bl_label = "More Presets"
+    preset_operator = "b_guides.execute_preset"
+    
+    def draw(self, context):
+        """Draw the presets past the main menu's limit"""
+        draw_preset_items(self.layout, self.preset_operator,
+                          list_presets()[MENU_PRESET_LIMIT:], get_active_preset(context))
+
+
 class B_GUIDES_OT_execute_preset(Operator):
     """Execute a preset and track which one was loaded"""
     
@@ -88,26 +200,22 @@ class B_GUIDES_OT_execute_preset(Operator):
     )
     
     def execute(self, context):
-        import os
-        
-        # Find the preset file
-        preset_paths = bpy.utils.preset_paths("b_guides")
-        preset_file = None
-        
-        for preset_path in preset_paths:
-            filepath = os.path.join(preset_path, self.preset_name + ".py")
-            if os.path.exists(filepath):
-                preset_file = filepath
-                break
+        # Look the preset up in the listing the menu was drawn from
+        preset_file = get_preset_file(self.preset_name)
+        try:
+            stat = os.stat(preset_file) if preset_file else None
+        except FileNotFoundError:
+            stat = None
         
-        if not preset_file:
+        if stat is None:
             self.report({'ERROR'}, f"Preset '{self.preset_name}' not found")
             return {'CANCELLED'}
         
-        # Execute the preset
+        # Execute the preset in a fresh namespace, like a standalone script
         try:
-            with open(preset_file, 'r') as file:
-                exec(compile(file.read(), preset_file, 'exec'))
+            code = get_preset_code(preset_file, (stat.st_mtime_ns, stat.st_size))
+            with batch_updates():
+                exec(code, {"__name__": "__main__", "__file__": preset_file})
         except Exception as e:
             self.report({'ERROR'}, f"Error executing preset: {str(e)}")
             return {'CANCELLED'}
@@ -118,7 +226,7 @@ class B_GUIDES_OT_execute_preset(Operator):
             context.scene.vse_guides.active_preset = self.preset_name
         else:
             cam = getattr(context.scene, 'camera', None)
-            if cam and hasattr(cam.data, 'camera_guides'):
+            if cam and cam.type == 'CAMERA':
                 cam.data.camera_guides.active_preset = self.preset_name
         
         return {'FINISHED'}
@@ -137,10 +245,11 @@ class B_GUIDES_OT_preset_add(AddPresetBase, Operator):
         "settings=(scene.vse_guides if is_vse else (cam.data.camera_guides if cam and hasattr(cam.data, 'camera_guides') else scene.vse_guides))",
     ]
     preset_values = PRESET_VALUES
-    preset_subdir = "b_guides"
+    preset_subdir = PRESET_SUBDIR
     
     def execute(self, context):
         result = super().execute(context)
+        invalidate_preset_cache()
         
         # If we successfully added a preset, update the active preset name
         if result == {'FINISHED'} and hasattr(self, 'name'):
@@ -149,7 +258,7 @@ class B_GUIDES_OT_preset_add(AddPresetBase, Operator):
                 context.scene.vse_guides.active_preset = self.name
             else:
                 cam = getattr(context.scene, 'camera', None)
-                if cam and hasattr(cam.data, 'camera_guides'):
+                if cam and cam.type == 'CAMERA':
                     cam.data.camera_guides.active_preset = self.name
         
         return result
@@ -157,16 +266,24 @@ class B_GUIDES_OT_preset_add(AddPresetBase, Operator):
 
 classes = (
     B_GUIDES_MT_presets,
+    B_GUIDES_MT_presets_more,
     B_GUIDES_OT_execute_preset,
     B_GUIDES_OT_preset_add,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    global _preset_paths
+    
+    # Create the user preset directory up front so it is part of the cached
+    # search paths and the menu never has to stat for it while drawing
+    bpy.utils.user_resource('SCRIPTS', path=os.path.join("presets", PRESET_SUBDIR), create=True)
+    _preset_paths = tuple(bpy.utils.preset_paths(PRESET_SUBDIR))
+    
+    _register_classes()
 
 
 def unregister():
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    _unregister_classes()
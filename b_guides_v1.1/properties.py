@@ -2,6 +2,9 @@
 
 import bpy
 import json
+import time
+from contextlib import contextmanager
+from bpy.app.handlers import persistent
 from bpy.types import PropertyGroup
 from bpy.props import (
     BoolProperty,
@@ -12,82 +15,441 @@ from bpy.props import (
     StringProperty,
 )
 
-def update_vse_areas():
-    """Force redraw of all sequencer areas"""
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            if area.type == 'SEQUENCE_EDITOR':
-                area.tag_redraw()
+# orjson is not bundled with Blender, use it when the user has installed it
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
+# Pending work flushed from a timer: area types to redraw and draw handlers
+# to re-check. Update callbacks only add to this set, so a burst of property
+# updates (slider drags, preset loads) is handled once, outside the
+# property-set call.
+_dirty = set()
 
-def update_3d_areas():
-    """Force redraw of all 3D viewport areas"""
-    for window in bpy.context.window_manager.windows:
-        for area in window.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+# Dirty keys for the draw handler registration checks
+VSE_HANDLER = 'VSE_HANDLER'
+VIEW3D_HANDLER = 'VIEW3D_HANDLER'
+
+# Minimum time between two flushes (about one frame)
+_REDRAW_INTERVAL = 1.0 / 60.0
+
+# Longer interval for count fields, which rebuild a lot of geometry per step
+# while being dragged
+_COUNT_REDRAW_INTERVAL = 0.15
+
+# Time of the last flush
+_last_flush_time = 0.0
+
+# The region the guides are drawn in, per editor type; only these regions are
+# tagged for redraw. The panels redraw on their own when a setting changes.
+_GUIDE_REGION_TYPES = {
+    'SEQUENCE_EDITOR': 'PREVIEW',
+    'VIEW_3D': 'WINDOW',
+}
+
+
+def _flush_redraws():
+    """Timer callback that applies all pending handler checks and redraws."""
+    global _last_flush_time
+    
+    # Nothing new since the last flush (e.g. a spurious timer re-fire)
+    if not _dirty:
+        return None
+    
+    dirty = _dirty.copy()
+    _dirty.clear()
+    
+    # Register draw handlers before tagging, so the redraw can use them
+    if VSE_HANDLER in dirty or VIEW3D_HANDLER in dirty:
+        try:
+            from . import update_vse_handler_state, update_3d_handler_state
+            if VSE_HANDLER in dirty:
+                update_vse_handler_state()
+            if VIEW3D_HANDLER in dirty:
+                update_3d_handler_state()
+        except ImportError:
+            pass
+    
+    window_manager = bpy.context.window_manager
+    if window_manager is not None:
+        # Areas are walked on every flush rather than cached: joining,
+        # splitting or swapping areas frees or retypes them without any
+        # notification to invalidate a cache
+        for window in window_manager.windows:
+            for area in window.screen.areas:
+                if area.type not in dirty:
+                    continue
+                # Collapsed areas have nothing on screen to refresh
+                if area.width <= 1 or area.height <= 1:
+                    continue
+                # Only the region the guides are drawn in
+                region_type = _GUIDE_REGION_TYPES[area.type]
+                for region in area.regions:
+                    if region.type == region_type:
+                        region.tag_redraw()
+    
+    _last_flush_time = time.perf_counter()
+    
+    # Returning None unregisters the timer
+    return None
+
+
+def _mark_dirty(*keys, interval=_REDRAW_INTERVAL):
+    """Queue area redraws / handler checks and schedule a flush if none is pending.
+    
+    The flush runs at most once per ``interval``, so continuous updates
+    such as dragging a color picker collapse into one redraw per frame.
+    An already pending flush is kept and picks up the new keys.
+    """
+    _dirty.update(keys)
+    if not bpy.app.timers.is_registered(_flush_redraws):
+        elapsed = time.perf_counter() - _last_flush_time
+        bpy.app.timers.register(_flush_redraws, first_interval=max(0.0, interval - elapsed))
+
+
+def update_vse_areas(interval=_REDRAW_INTERVAL):
+    """Request a redraw of all sequencer areas"""
+    _mark_dirty('SEQUENCE_EDITOR', interval=interval)
+
+
+def update_3d_areas(interval=_REDRAW_INTERVAL):
+    """Request a redraw of all 3D viewport areas"""
+    _mark_dirty('VIEW_3D', interval=interval)
 
 
 def update_all_areas():
-    """Force redraw of all relevant areas"""
+    """Request a redraw of all relevant areas"""
     update_vse_areas()
     update_3d_areas()
 
 
+# Enum items, shared by every property that uses them
+ORIENTATION_ITEMS = (
+    ('HORIZONTAL', "Horizontal", "Horizontal guide"),
+    ('VERTICAL', "Vertical", "Vertical guide"),
+)
+
+RULER_UNITS_ITEMS = (
+    ('RESOLUTION', "Resolution", "Show measurements in resolution pixels"),
+    ('PIXELS', "Pixels", "Show measurements in display pixels"),
+    ('PERCENT', "Percentage", "Show measurements as percentage"),
+)
+
+# Enabled toggles per settings group, keyed by the owning ID's session_uid.
+# Refreshed only when a toggle changes instead of scanning on every draw.
+_enabled_guides_cache = {}
+
+
+def get_enabled_guides(settings):
+    """Return the names of the enabled guide toggles of a settings group."""
+    key = settings.id_data.session_uid
+    enabled = _enabled_guides_cache.get(key)
+    if enabled is None:
+        enabled = tuple(name for name in GUIDE_TOGGLES if getattr(settings, name))
+        _enabled_guides_cache[key] = enabled
+    return enabled
+
+
+def invalidate_enabled_guides(settings=None):
+    """Forget the cached toggles of one settings group, or of all of them."""
+    if settings is None:
+        _enabled_guides_cache.clear()
+    else:
+        _enabled_guides_cache.pop(settings.id_data.session_uid, None)
+
+
+# Bumped whenever any guide setting changes, so draw code can keep geometry
+# baked for the last seen value. Changes that bypass update callbacks
+# (undo, file load, animation, drivers) bump it through the handlers instead.
+_generation = 0
+
+
+def get_generation():
+    """Return the current settings generation."""
+    return _generation
+
+
+def mark_settings_changed():
+    """Invalidate geometry baked from the guide settings."""
+    global _generation
+    _generation += 1
+
+
+@persistent
+def _undo_redo_handler(*args):
+    """Undo/redo restores settings without running update callbacks."""
+    invalidate_enabled_guides()
+    mark_settings_changed()
+
+
+def _is_guide_owner(id_data):
+    """Whether an ID carries guide settings (a Scene or a Camera datablock)."""
+    return isinstance(id_data, (bpy.types.Scene, bpy.types.Camera))
+
+
+def _has_animation(id_data):
+    """Whether an ID has an action or drivers that can change its settings."""
+    animation_data = id_data.animation_data
+    return animation_data is not None and (
+        animation_data.action is not None or len(animation_data.drivers) > 0
+    )
+
+
+def _external_settings_change(owners):
+    """Handle guide settings of the given IDs changed without update callbacks."""
+    if not owners:
+        return
+    mark_settings_changed()
+    
+    # Refresh the cached toggles of just these settings groups; an animated
+    # show_* toggle that flipped needs its draw handler re-checked
+    for owner in owners:
+        if isinstance(owner, bpy.types.Scene):
+            settings, handler_key = owner.vse_guides, VSE_HANDLER
+        else:
+            settings, handler_key = owner.camera_guides, VIEW3D_HANDLER
+        cached = _enabled_guides_cache.pop(owner.session_uid, None)
+        if cached is not None and get_enabled_guides(settings) != cached:
+            _mark_dirty(handler_key)
+
+
+@persistent
+def _frame_change_handler(scene, *args):
+    """Keyframes and drivers change settings without update callbacks."""
+    owners = [scene] if _has_animation(scene) else []
+    camera = scene.camera
+    if camera is not None and camera.type == 'CAMERA' and _has_animation(camera.data):
+        owners.append(camera.data)
+    _external_settings_change(owners)
+
+
+@persistent
+def _depsgraph_update_handler(scene, depsgraph):
+    """Drivers and foreach/IDProperty writes change settings without update callbacks."""
+    if not (depsgraph.id_type_updated('SCENE') or depsgraph.id_type_updated('CAMERA')):
+        return
+    _external_settings_change([
+        update.id.original for update in depsgraph.updates
+        if _is_guide_owner(update.id.original)
+    ])
+
+
+# Nesting depth of batch_updates(); update callbacks do nothing while > 0
+_batch_depth = 0
+
+
+@contextmanager
+def batch_updates():
+    """Suppress property update callbacks while assigning many settings.
+    
+    Areas are redrawn and the draw handlers re-checked once after exit
+    instead of once per assigned property.
+    """
+    global _batch_depth
+    _batch_depth += 1
+    try:
+        yield
+    finally:
+        _batch_depth -= 1
+        if _batch_depth == 0:
+            invalidate_enabled_guides()
+            mark_settings_changed()
+            _mark_dirty('SEQUENCE_EDITOR', 'VIEW_3D', VSE_HANDLER, VIEW3D_HANDLER)
+
+
 def update_vse_visibility(self, context):
     """Update callback for VSE guide visibility properties."""
-    update_vse_areas()
-    # Trigger handler registration check
-    try:
-        from . import update_vse_handler_state
-        update_vse_handler_state()
-    except ImportError:
-        pass
+    invalidate_enabled_guides(self)
+    mark_settings_changed()
+    if _batch_depth:
+        return
+    # Redraw and re-check the draw handler registration on the next flush
+    _mark_dirty('SEQUENCE_EDITOR', VSE_HANDLER)
 
 
 def update_3d_visibility(self, context):
     """Update callback for 3D/Camera guide visibility properties."""
-    update_3d_areas()
-    # Trigger handler registration check
-    try:
-        from . import update_3d_handler_state
-        update_3d_handler_state()
-    except ImportError:
-        pass
+    invalidate_enabled_guides(self)
+    mark_settings_changed()
+    if _batch_depth:
+        return
+    # Redraw and re-check the draw handler registration on the next flush
+    _mark_dirty('VIEW_3D', VIEW3D_HANDLER)
+
+
+def update_vse_visual(self, context):
+    """Update callback for VSE guide options; skips the redraw while no guide is shown."""
+    mark_settings_changed()
+    if _batch_depth:
+        return
+    if get_enabled_guides(self):
+        update_vse_areas()
+
+
+def update_3d_visual(self, context):
+    """Update callback for camera guide options; skips the redraw while no guide is shown."""
+    mark_settings_changed()
+    if _batch_depth:
+        return
+    if get_enabled_guides(self):
+        update_3d_areas()
 
 
+# Reused encoder for the stdlib fallback. Output is compact since the string
+# is only ever read back by deserialize_guides, and the data is a plain tree
+# of lists/dicts, so the circular-reference check can be skipped.
+_GUIDES_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(',', ':'), check_circular=False)
+
+# Default color for guide lines, shared by both guide types and the loader
+GUIDE_DEFAULT_COLOR = (0.0, 0.4, 1.0, 0.5)
+
+# Version of the positional guide schema written by serialize_guides. Each
+# guide is [name, position_x, position_y, rotation, orientation, color].
+# Presets saved before it hold a plain list of per-guide dicts.
+GUIDES_SCHEMA_VERSION = 2
+
 
 def serialize_guides(guides_collection):
-    data = []
-    for guide in guides_collection:
-        data.append({
-            "name": guide.name,
-            "position_x": guide.position_x,
-            "position_y": guide.position_y,
-            "rotation": guide.rotation,
-            "orientation": guide.orientation,
-            "color": list(guide.color),
-        })
-    return json.dumps(data)
+    count = len(guides_collection)
+    
+    # Pull the float fields in bulk instead of one RNA access per guide
+    position_x = [0.0] * count
+    position_y = [0.0] * count
+    rotation = [0.0] * count
+    colors = [0.0] * (count * 4)
+    guides_collection.foreach_get("position_x", position_x)
+    guides_collection.foreach_get("position_y", position_y)
+    guides_collection.foreach_get("rotation", rotation)
+    guides_collection.foreach_get("color", colors)
+    
+    data = {
+        "v": GUIDES_SCHEMA_VERSION,
+        "g": [
+            [guide.name, position_x[i], position_y[i], rotation[i],
+             guide.orientation, colors[i * 4:i * 4 + 4]]
+            for i, guide in enumerate(guides_collection)
+        ],
+    }
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return _GUIDES_ENCODER.encode(data)
+
+
+_ORIENTATION_IDS = frozenset(item[0] for item in ORIENTATION_ITEMS)
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_valid_guide_entry(entry):
+    """Check one [name, x, y, rotation, orientation, color] guide entry."""
+    if not isinstance(entry, (list, tuple)) or len(entry) != 6:
+        return False
+    name, x, y, angle, orientation, color = entry
+    return (
+        isinstance(name, str)
+        and _is_number(x) and _is_number(y) and _is_number(angle)
+        and orientation in _ORIENTATION_IDS
+        and isinstance(color, (list, tuple)) and len(color) == 4
+        and all(_is_number(c) for c in color)
+    )
 
 
 def deserialize_guides(guides_collection, value):
     if not value:
         return
+    # Re-applying the preset that is already loaded (and unedited) would
+    # only rebuild the same guides
+    if value == serialize_guides(guides_collection):
+        return
     try:
-        data = json.loads(value)
+        if orjson is not None:
+            data = orjson.loads(value)
+        else:
+            data = json.loads(value)
     except ValueError:
+        if bpy.app.debug_python:
+            print("B Guides: Ignoring guide lines that are not valid JSON")
         return
+    
+    if isinstance(data, dict):
+        if data.get("v") != GUIDES_SCHEMA_VERSION:
+            if bpy.app.debug_python:
+                print(f"B Guides: Ignoring guide lines with unsupported version {data.get('v')!r}")
+            return
+        items = data.get("g")
+        if not isinstance(items, list):
+            if bpy.app.debug_python:
+                print("B Guides: Ignoring guide lines without a list of guides")
+            return
+    elif isinstance(data, list):
+        # Legacy presets: one dict per guide
+        items = [
+            (item.get("name", "Guide"), item.get("position_x", 0.0), item.get("position_y", 0.0),
+             item.get("rotation", 0.0), item.get("orientation", "HORIZONTAL"),
+             item.get("color", GUIDE_DEFAULT_COLOR))
+            if isinstance(item, dict) else item
+            for item in data
+        ]
+    else:
+        if bpy.app.debug_python:
+            print("B Guides: Ignoring guide lines that are not a list or object")
+        return
+    
+    # Skip malformed entries (e.g. a hand-edited or truncated preset) rather
+    # than raising from inside the property setter
+    valid_items = [item for item in items if _is_valid_guide_entry(item)]
+    if len(valid_items) != len(items) and bpy.app.debug_python:
+        print(f"B Guides: Skipped {len(items) - len(valid_items)} malformed guide line(s)")
+    items = valid_items
+
+    # Reuse the existing guide items, only adding or removing the difference
+    count = len(items)
+    while len(guides_collection) > count:
+        guides_collection.remove(len(guides_collection) - 1)
+    while len(guides_collection) < count:
+        guides_collection.add()
+    
+    position_x = []
+    position_y = []
+    rotation = []
+    colors = []
+    for guide, (name, x, y, angle, orientation, color) in zip(guides_collection, items):
+        # Reused items often already match; skip the RNA string writes then
+        if guide.name != name:
+            guide.name = name
+        if guide.orientation != orientation:
+            guide.orientation = orientation
+        position_x.append(x)
+        position_y.append(y)
+        rotation.append(angle)
+        colors.extend(color)
+    
+    # Write the float fields in bulk; foreach_set skips update callbacks,
+    # so redraw once afterwards
+    guides_collection.foreach_set("position_x", position_x)
+    guides_collection.foreach_set("position_y", position_y)
+    guides_collection.foreach_set("rotation", rotation)
+    guides_collection.foreach_set("color", colors)
+    update_all_areas()
+
+
+def get_vse_guides_data(self):
+    return serialize_guides(self.id_data.custom_guides)
+
+
+def set_vse_guides_data(self, value):
+    deserialize_guides(self.id_data.custom_guides, value)
 
-    guides_collection.clear()
-    for item in data:
-        guide = guides_collection.add()
-        guide.name = item.get("name", "Guide")
-        guide.position_x = item.get("position_x", 0.0)
-        guide.position_y = item.get("position_y", 0.0)
-        guide.rotation = item.get("rotation", 0.0)
-        guide.orientation = item.get("orientation", "HORIZONTAL")
-        guide.color = item.get("color", (0.0, 0.4, 1.0, 0.5))
+
+def get_camera_guides_data(self):
+    return serialize_guides(self.id_data.custom_camera_guides)
+
+
+def set_camera_guides_data(self, value):
+    deserialize_guides(self.id_data.custom_camera_guides, value)
 
 
 class CustomGuide(PropertyGroup):
@@ -105,8 +467,7 @@ class CustomGuide(PropertyGroup):
         default=0.0,
         min=-1.0,
         max=1.0,
-        step=1.0,
-        update=lambda self, context: update_all_areas()
+        step=1.0
     )
     
     position_y: FloatProperty(
@@ -115,24 +476,19 @@ class CustomGuide(PropertyGroup):
         default=0.0,
         min=-1.0,
         max=1.0,
-        step=1.0,
-        update=lambda self, context: update_all_areas()
+        step=1.0
     )
     
     rotation: FloatProperty(
         name="Rotation",
         description="Guide rotation in degrees",
         default=0.0,
-        unit='ROTATION',
-        update=lambda self, context: update_all_areas()
+        unit='ROTATION'
     )
     
     orientation: EnumProperty(
         name="Orientation",
-        items=[
-            ('HORIZONTAL', "Horizontal", "Horizontal guide"),
-            ('VERTICAL', "Vertical", "Vertical guide"),
-        ],
+        items=ORIENTATION_ITEMS,
         default='HORIZONTAL'
     )
     
@@ -142,1064 +498,553 @@ class CustomGuide(PropertyGroup):
         size=4,
         min=0.0,
         max=1.0,
-        default=(0.0, 0.4, 1.0, 0.5)
+        default=GUIDE_DEFAULT_COLOR
     )
 
 
-class VSEGuidesSettings(PropertyGroup):
-    """Main settings for VSE Guides"""
-    
-    # Guide toggles
-    show_thirds: BoolProperty(
-        name="Rule of Thirds",
-        description="Show rule of thirds guide",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    thirds_color: FloatVectorProperty(
-        name="Thirds Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    show_golden: BoolProperty(
-        name="Golden Ratio",
-        description="Show golden ratio guide",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    golden_color: FloatVectorProperty(
-        name="Golden Color",
+# Default color for composition guide lines
+GUIDE_LINE_COLOR = (1.0, 1.0, 1.0, 0.5)
+
+# Defaults for the ruler background and the grid
+RULER_BG_COLOR = (0.16, 0.16, 0.16, 0.96)
+GRID_LINE_COLOR = (1.0, 1.0, 1.0, 0.3)
+
+
+def _color_property(name, update, default=GUIDE_LINE_COLOR):
+    """Return an RGBA color property as used by the guide settings."""
+    return FloatVectorProperty(
+        name=name,
         subtype='COLOR',
         size=4,
         min=0.0,
         max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
+        default=default,
+        update=update
     )
-    
-    show_center: BoolProperty(
-        name="Center Guides",
-        description="Show center cross or full crosshair",
-        default=False,
-        update=update_vse_visibility
-    )
-    
 
+
+# Option update callbacks, shared per (toggle, redraw, interval)
+_option_callbacks = {}
+
+
+def _option_update(toggle_name, redraw, interval=_REDRAW_INTERVAL):
+    """Return an update callback that redraws only while ``toggle_name`` is enabled."""
+    key = (toggle_name, redraw, interval)
+    callback = _option_callbacks.get(key)
+    if callback is None:
+        def callback(self, context):
+            mark_settings_changed()
+            if not _batch_depth and getattr(self, toggle_name):
+                redraw(interval)
+        _option_callbacks[key] = callback
+    return callback
+
+
+def _guide_settings_annotations(update, visual_update, redraw, ruler_color,
+                                get_guides_data, set_guides_data):
+    """Build the property annotations shared by the VSE and camera settings.
+    
+    Both groups expose the same guides and differ only in their update
+    callbacks, the default ruler color and which collection
+    custom_guides_data reads from. ``update`` is used by the guide toggles.
+    Options that belong to a single guide only call ``redraw`` while that
+    guide is enabled; shared options use ``visual_update``. Count fields
+    redraw at a slower rate since each step rebuilds their geometry.
+    """
+    def option_update(toggle_name, interval=_REDRAW_INTERVAL):
+        return _option_update(toggle_name, redraw, interval)
+    
+    return {
+        # Guide toggles
+        'show_thirds': BoolProperty(
+            name="Rule of Thirds",
+            description="Show rule of thirds guide",
+            default=False,
+            update=update
+        ),
+
+        'thirds_color': _color_property("Thirds Color", option_update('show_thirds')),
+
+        'show_golden': BoolProperty(
+            name="Golden Ratio",
+            description="Show golden ratio guide",
+            default=False,
+            update=update
+        ),
+
+        'golden_color': _color_property("Golden Color", option_update('show_golden')),
+
+        'show_center': BoolProperty(
+            name="Center Guides",
+            description="Show center cross or full crosshair",
+            default=False,
+            update=update
+        ),
+
+        'center_color': _color_property("Center Color", option_update('show_center')),
+
+        'show_diagonals': BoolProperty(
+            name="Diagonals",
+            description="Show diagonal guides",
+            default=False,
+            update=update
+        ),
+
+        'diagonals_color': _color_property("Diagonals Color", option_update('show_diagonals')),
+
+        'show_golden_spiral': BoolProperty(
+            name="Golden Spiral",
+            description="Show Fibonacci/golden spiral",
+            default=False,
+            update=update
+        ),
+
+        'golden_spiral_flip_h': BoolProperty(
+            name="Flip Horizontal",
+            description="Flip golden spiral horizontally",
+            default=False,
+            update=option_update('show_golden_spiral')
+        ),
+
+        'golden_spiral_flip_v': BoolProperty(
+            name="Flip Vertical",
+            description="Flip golden spiral vertically",
+            default=False,
+            update=option_update('show_golden_spiral')
+        ),
+
+        'golden_spiral_length': IntProperty(
+            name="Spiral Length",
+            description="Number of spiral iterations",
+            min=1,
+            max=24,
+            default=8,
+            update=option_update('show_golden_spiral', _COUNT_REDRAW_INTERVAL)
+        ),
+
+        'golden_spiral_show_segments': BoolProperty(
+            name="Show Segments",
+            description="Show subdivision squares",
+            default=True,
+            update=option_update('show_golden_spiral')
+        ),
+
+        'golden_spiral_fit': BoolProperty(
+            name="Fit to Frame",
+            description="Stretch spiral to fit frame boundary",
+            default=False,
+            update=option_update('show_golden_spiral')
+        ),
+
+        'golden_spiral_color': _color_property("Spiral Color", option_update('show_golden_spiral')),
+
+        'show_golden_triangle': BoolProperty(
+            name="Triangle",
+            description="Show golden triangle composition",
+            default=False,
+            update=update
+        ),
+
+        'golden_triangle_rotation': FloatProperty(
+            name="Rotation",
+            description="Rotation in degrees",
+            default=0.0,
+            unit='ROTATION',
+            update=option_update('show_golden_triangle')
+        ),
+
+        'golden_triangle_scale': FloatProperty(
+            name="Scale",
+            description="Scale of the triangle (0.1 to 2.0)",
+            min=0.1,
+            max=2.0,
+            default=1.0,
+            update=option_update('show_golden_triangle')
+        ),
+
+        'golden_triangle_count': IntProperty(
+            name="Triangle Count",
+            description="Number of nested triangles",
+            min=1,
+            max=10,
+            default=1,
+            update=option_update('show_golden_triangle', _COUNT_REDRAW_INTERVAL)
+        ),
+
+        'golden_triangle_color': _color_property("Triangle Color", option_update('show_golden_triangle')),
+
+        'show_radial_symmetry': BoolProperty(
+            name="Radial Symmetry",
+            description="Show radial symmetry lines",
+            default=False,
+            update=update
+        ),
+
+        'radial_symmetry_color': _color_property("Radial Color", option_update('show_radial_symmetry')),
+
+        'radial_line_count': IntProperty(
+            name="Line Count",
+            description="Number of radial symmetry lines",
+            min=2,
+            max=32,
+            default=8,
+            update=option_update('show_radial_symmetry', _COUNT_REDRAW_INTERVAL)
+        ),
+
+        'show_vanishing_point': BoolProperty(
+            name="Vanishing Point Grid",
+            description="Show perspective vanishing point grid",
+            default=False,
+            update=update
+        ),
+
+        'vanishing_point_color': _color_property("VP Color", option_update('show_vanishing_point')),
+
+        'vanishing_point_x': FloatProperty(
+            name="VP X Position",
+            description="Vanishing point X position (0-1)",
+            min=0.0,
+            max=1.0,
+            default=0.5,
+            update=option_update('show_vanishing_point')
+        ),
+
+        'vanishing_point_y': FloatProperty(
+            name="VP Y Position",
+            description="Vanishing point Y position (0-1)",
+            min=0.0,
+            max=1.0,
+            default=0.5,
+            update=option_update('show_vanishing_point')
+        ),
+
+        'vanishing_point_lines': IntProperty(
+            name="Line Count",
+            description="Subdivisions per edge (1=corners only, 2=+midpoints, etc.)",
+            min=1,
+            max=16,
+            default=1,
+            update=option_update('show_vanishing_point', _COUNT_REDRAW_INTERVAL)
+        ),
+
+        'show_vanishing_point_grid': BoolProperty(
+            name="Show Grid",
+            description="Show perspective grid lines",
+            default=False,
+            update=option_update('show_vanishing_point')
+        ),
+
+        'vanishing_point_grid_count': IntProperty(
+            name="Grid Count",
+            description="Number of perspective grid lines",
+            min=2,
+            max=64,
+            default=10,
+            update=option_update('show_vanishing_point', _COUNT_REDRAW_INTERVAL)
+        ),
+
+        'show_circular_thirds': BoolProperty(
+            name="Circular",
+            description="Show circular/concentric rule of thirds",
+            default=False,
+            update=update
+        ),
+
+        'circular_thirds_count': IntProperty(
+            name="Circle Count",
+            description="Number of concentric circles",
+            min=1,
+            max=10,
+            default=3,
+            update=option_update('show_circular_thirds', _COUNT_REDRAW_INTERVAL)
+        ),
+
+        'circular_thirds_fit': BoolProperty(
+            name="Fit to Frame",
+            description="Stretch circles to fit frame boundary (creates ellipses)",
+            default=False,
+            update=option_update('show_circular_thirds')
+        ),
+
+        'circular_thirds_color': _color_property("Circular Color", option_update('show_circular_thirds')),
+
+        'show_diagonal_reciprocals': BoolProperty(
+            name="Diagonal Reciprocals",
+            description="Show diagonal reciprocal composition guides",
+            default=False,
+            update=update
+        ),
+
+        'diagonal_reciprocals_color': _color_property("Diagonal Reciprocals Color", option_update('show_diagonal_reciprocals')),
+
+        'show_harmony_triangles': BoolProperty(
+            name="Golden Triangle",
+            description="Show harmony triangle composition guides",
+            default=False,
+            update=update
+        ),
+
+        'harmony_triangles_color': _color_property("Golden Triangle Color", option_update('show_harmony_triangles')),
+
+        'harmony_triangles_flip': BoolProperty(
+            name="Flip",
+            description="Flip harmony triangles",
+            default=False,
+            update=option_update('show_harmony_triangles')
+        ),
+
+        'show_diagonal_method': BoolProperty(
+            name="Diagonal Method",
+            description="Show 45-degree diagonal lines from corners",
+            default=False,
+            update=update
+        ),
+
+        'diagonal_method_color': _color_property("Diagonal Method Color", option_update('show_diagonal_method')),
+
+        'diagonal_method_angle': FloatProperty(
+            name="Angle",
+            description="Angle of diagonal lines",
+            default=45.0,
+            min=0.0,
+            max=90.0,
+            update=option_update('show_diagonal_method')
+        ),
+
+        # Ruler settings
+        'show_rulers': BoolProperty(
+            name="Show Rulers",
+            description="Show rulers with measurements",
+            default=False,
+            update=update
+        ),
+
+        'ruler_units': EnumProperty(
+            name="Units",
+            description="Ruler measurement units",
+            items=RULER_UNITS_ITEMS,
+            default='RESOLUTION',
+            update=option_update('show_rulers')
+        ),
+
+        'ruler_color': _color_property("Ruler Color", option_update('show_rulers'), default=ruler_color),
+
+        'line_width': FloatProperty(
+            name="Line Width",
+            description="Width of guide lines",
+            min=0.5,
+            max=5.0,
+            default=1.0,
+            update=visual_update
+        ),
+
+        'ruler_size': IntProperty(
+            name="Ruler Size",
+            description="Height/width of ruler bars",
+            min=20,
+            max=50,
+            default=30,
+            update=option_update('show_rulers')
+        ),
+
+        'bg_color': _color_property("BG Color", option_update('show_rulers'), default=RULER_BG_COLOR),
+
+        # Grid settings
+        'show_grid': BoolProperty(
+            name="Grid",
+            description="Show grid overlay",
+            default=False,
+            update=update
+        ),
+
+        'grid_divisions': IntProperty(
+            name="Grid Divisions",
+            description="Number of grid divisions",
+            min=2,
+            max=32,
+            default=8,
+            update=option_update('show_grid', _COUNT_REDRAW_INTERVAL)
+        ),
+
+        'grid_square': BoolProperty(
+            name="Square Grid",
+            description="Force square grid cells (equal width and height)",
+            default=False,
+            update=option_update('show_grid')
+        ),
+
+        'grid_color': _color_property("Grid Color", option_update('show_grid'), default=GRID_LINE_COLOR),
+
+        # Guide Lines
+        'show_custom_guides': BoolProperty(
+            name="Guide Lines",
+            description="Show guide lines",
+            default=True,
+            update=update
+        ),
+
+        'active_guide_index': IntProperty(
+            name="Active Guide",
+            description="Active custom guide index",
+            default=0
+        ),
+
+        # Frame clipping
+        'hide_guides_outside_frame': BoolProperty(
+            name="Hide Guides Outside Frame",
+            description="Hide guide lines that extend outside the frame boundaries",
+            default=True,
+            update=visual_update
+        ),
+
+        # Internal storage for toggle state
+        'stored_active_guides': bpy.props.StringProperty(
+            default=""
+        ),
+
+        # Preset management
+        'active_preset': bpy.props.StringProperty(
+            name="Active Preset",
+            description="Currently selected preset",
+            default=""
+        ),
+
+        'new_preset_name': bpy.props.StringProperty(
+            name="New Preset Name",
+            description="Name for saving a new preset",
+            default=""
+        ),
+
+        'custom_guides_data': StringProperty(
+            name="Custom Guides Data",
+            description="Serialized custom guides data for presets",
+            default="",
+            get=get_guides_data,
+            set=set_guides_data,
+            options={'HIDDEN'}
+        ),
+    }
+
+
+class VSEGuidesSettings(PropertyGroup):
+    """Main settings for VSE Guides"""
     
-    center_color: FloatVectorProperty(
-        name="Center Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
+    __annotations__ = _guide_settings_annotations(
+        update=update_vse_visibility,
+        visual_update=update_vse_visual,
+        redraw=update_vse_areas,
+        ruler_color=(1.0, 1.0, 1.0, 0.5),
+        get_guides_data=get_vse_guides_data,
+        set_guides_data=set_vse_guides_data,
     )
+
+
+# Master toggle of every guide, taken from the settings schema: the toggles
+# are the properties wired to the visibility callback. (A "show_" prefix
+# is not enough, options such as show_vanishing_point_grid share it.)
+GUIDE_TOGGLES = tuple(
+    name for name, prop in VSEGuidesSettings.__annotations__.items()
+    if prop.keywords.get('update') is update_vse_visibility
+)
+
+
+class CustomCameraGuide(PropertyGroup):
+    """Custom guide for camera - stored per camera"""
     
-    show_diagonals: BoolProperty(
-        name="Diagonals",
-        description="Show diagonal guides",
-        default=False,
-        update=update_vse_visibility
+    name: bpy.props.StringProperty(
+        name="Name",
+        description="Guide name",
+        default="Guide"
     )
     
-    diagonals_color: FloatVectorProperty(
-        name="Diagonals Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
+    position_x: FloatProperty(
+        name="X",
+        description="Guide X position (normalized: -1=Left, 0=Center, 1=Right)",
+        default=0.0,
+        min=-1.0,
         max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    show_golden_spiral: BoolProperty(
-        name="Golden Spiral",
-        description="Show Fibonacci/golden spiral",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    golden_spiral_flip_h: BoolProperty(
-        name="Flip Horizontal",
-        description="Flip golden spiral horizontally",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    golden_spiral_flip_v: BoolProperty(
-        name="Flip Vertical",
-        description="Flip golden spiral vertically",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    golden_spiral_length: IntProperty(
-        name="Spiral Length",
-        description="Number of spiral iterations",
-        min=1,
-        max=24,
-        default=8,
-        update=update_vse_visibility
-    )
-    
-    golden_spiral_show_segments: BoolProperty(
-        name="Show Segments",
-        description="Show subdivision squares",
-        default=True,
-        update=update_vse_visibility
-    )
-    
-    golden_spiral_fit: BoolProperty(
-        name="Fit to Frame",
-        description="Stretch spiral to fit frame boundary",
-        default=False,
-        update=update_vse_visibility
+        step=1.0
     )
     
-    golden_spiral_color: FloatVectorProperty(
-        name="Spiral Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
+    position_y: FloatProperty(
+        name="Y",
+        description="Guide Y position (normalized: -1=Bottom, 0=Center, 1=Top)",
+        default=0.0,
+        min=-1.0,
         max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    show_golden_triangle: BoolProperty(
-        name="Triangle",
-        description="Show golden triangle composition",
-        default=False,
-        update=update_vse_visibility
+        step=1.0
     )
     
-    golden_triangle_rotation: FloatProperty(
+    rotation: FloatProperty(
         name="Rotation",
-        description="Rotation in degrees",
+        description="Guide rotation in degrees",
         default=0.0,
-        unit='ROTATION',
-        update=update_vse_visibility
-    )
-    
-    golden_triangle_scale: FloatProperty(
-        name="Scale",
-        description="Scale of the triangle (0.1 to 2.0)",
-        min=0.1,
-        max=2.0,
-        default=1.0,
-        update=update_vse_visibility
-    )
-    
-    golden_triangle_count: IntProperty(
-        name="Triangle Count",
-        description="Number of nested triangles",
-        min=1,
-        max=10,
-        default=1,
-        update=update_vse_visibility
-    )
-    
-    golden_triangle_color: FloatVectorProperty(
-        name="Triangle Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    
-    show_radial_symmetry: BoolProperty(
-        name="Radial Symmetry",
-        description="Show radial symmetry lines",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    radial_symmetry_color: FloatVectorProperty(
-        name="Radial Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
+        unit='ROTATION'
     )
     
-    radial_line_count: IntProperty(
-        name="Line Count",
-        description="Number of radial symmetry lines",
-        min=2,
-        max=32,
-        default=8,
-        update=update_vse_visibility
-    )
-    
-    show_vanishing_point: BoolProperty(
-        name="Vanishing Point Grid",
-        description="Show perspective vanishing point grid",
-        default=False,
-        update=update_vse_visibility
+    orientation: EnumProperty(
+        name="Orientation",
+        items=ORIENTATION_ITEMS,
+        default='HORIZONTAL'
     )
     
-    vanishing_point_color: FloatVectorProperty(
-        name="VP Color",
+    color: FloatVectorProperty(
+        name="Color",
         subtype='COLOR',
         size=4,
         min=0.0,
         max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    vanishing_point_x: FloatProperty(
-        name="VP X Position",
-        description="Vanishing point X position (0-1)",
-        min=0.0,
-        max=1.0,
-        default=0.5,
-        update=update_vse_visibility
-    )
-    
-    vanishing_point_y: FloatProperty(
-        name="VP Y Position",
-        description="Vanishing point Y position (0-1)",
-        min=0.0,
-        max=1.0,
-        default=0.5,
-        update=update_vse_visibility
+        default=GUIDE_DEFAULT_COLOR
     )
+
+
+class CameraGuidesSettings(PropertyGroup):
+    """Guide settings stored per camera"""
     
-    vanishing_point_lines: IntProperty(
-        name="Line Count",
-        description="Subdivisions per edge (1=corners only, 2=+midpoints, etc.)",
-        min=1,
-        max=16,
-        default=1,
-        update=update_vse_visibility
+    __annotations__ = _guide_settings_annotations(
+        update=update_3d_visibility,
+        visual_update=update_3d_visual,
+        redraw=update_3d_areas,
+        ruler_color=(1.0, 1.0, 1.0, 0.8),
+        get_guides_data=get_camera_guides_data,
+        set_guides_data=set_camera_guides_data,
     )
-    
-    show_vanishing_point_grid: BoolProperty(
-        name="Show Grid",
-        description="Show perspective grid lines",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    vanishing_point_grid_count: IntProperty(
-        name="Grid Count",
-        description="Number of perspective grid lines",
-        min=2,
-        max=64,
-        default=10,
-        update=update_vse_visibility
-    )
-    
-    show_circular_thirds: BoolProperty(
-        name="Circular",
-        description="Show circular/concentric rule of thirds",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    circular_thirds_count: IntProperty(
-        name="Circle Count",
-        description="Number of concentric circles",
-        min=1,
-        max=10,
-        default=3,
-        update=update_vse_visibility
-    )
-    
-    circular_thirds_fit: BoolProperty(
-        name="Fit to Frame",
-        description="Stretch circles to fit frame boundary (creates ellipses)",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    circular_thirds_color: FloatVectorProperty(
-        name="Circular Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    show_diagonal_reciprocals: BoolProperty(
-        name="Diagonal Reciprocals",
-        description="Show diagonal reciprocal composition guides",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    diagonal_reciprocals_color: FloatVectorProperty(
-        name="Diagonal Reciprocals Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    show_harmony_triangles: BoolProperty(
-        name="Golden Triangle",
-        description="Show harmony triangle composition guides",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    harmony_triangles_color: FloatVectorProperty(
-        name="Golden Triangle Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    harmony_triangles_flip: BoolProperty(
-        name="Flip",
-        description="Flip harmony triangles",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    show_diagonal_method: BoolProperty(
-        name="Diagonal Method",
-        description="Show 45-degree diagonal lines from corners",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    diagonal_method_color: FloatVectorProperty(
-        name="Diagonal Method Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    diagonal_method_angle: FloatProperty(
-        name="Angle",
-        description="Angle of diagonal lines",
-        default=45.0,
-        min=0.0,
-        max=90.0,
-        update=update_vse_visibility
-    )
-    
-    # Ruler settings
-    show_rulers: BoolProperty(
-        name="Show Rulers",
-        description="Show rulers with measurements",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    ruler_units: EnumProperty(
-        name="Units",
-        description="Ruler measurement units",
-        items=[
-            ('RESOLUTION', "Resolution", "Show measurements in resolution pixels"),
-            ('PIXELS', "Pixels", "Show measurements in display pixels"),
-            ('PERCENT', "Percentage", "Show measurements as percentage"),
-        ],
-        default='RESOLUTION',
-        update=update_vse_visibility
-    )
-    
-    # Visual settings
 
-    
-    ruler_color: FloatVectorProperty(
-        name="Ruler Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_vse_visibility
-    )
-    
-    line_width: FloatProperty(
-        name="Line Width",
-        description="Width of guide lines",
-        min=0.5,
-        max=5.0,
-        default=1.0,
-        update=update_vse_visibility
-    )
-    
-    ruler_size: IntProperty(
-        name="Ruler Size",
-        description="Height/width of ruler bars",
-        min=20,
-        max=50,
-        default=30,
-        update=update_vse_visibility
-    )
-    
-    bg_color: FloatVectorProperty(
-        name="BG Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(0.16, 0.16, 0.16, 0.96),
-        update=update_vse_visibility
-    )
-    
-    # Grid settings
-    show_grid: BoolProperty(
-        name="Grid",
-        description="Show grid overlay",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    grid_divisions: IntProperty(
-        name="Grid Divisions",
-        description="Number of grid divisions",
-        min=2,
-        max=32,
-        default=8,
-        update=update_vse_visibility
-    )
-    
-    grid_square: BoolProperty(
-        name="Square Grid",
-        description="Force square grid cells (equal width and height)",
-        default=False,
-        update=update_vse_visibility
-    )
-    
-    grid_color: FloatVectorProperty(
-        name="Grid Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.3),
-        update=update_vse_visibility
-    )
-    
-    # Guide Lines
-    show_custom_guides: BoolProperty(
-        name="Guide Lines",
-        description="Show guide lines",
-        default=True,
-        update=update_vse_visibility
-    )
-    
-    active_guide_index: IntProperty(
-        name="Active Guide",
-        description="Active custom guide index",
-        default=0
-    )
-    
-    # Frame clipping
-    hide_guides_outside_frame: BoolProperty(
-        name="Hide Guides Outside Frame",
-        description="Hide guide lines that extend outside the frame boundaries",
-        default=True,
-        update=lambda self, context: update_all_areas()
-    )
-    
-    # Internal storage for toggle state
-    stored_active_guides: bpy.props.StringProperty(
-        default=""
-    )
-    
-    # Preset management
-    active_preset: bpy.props.StringProperty(
-        name="Active Preset",
-        description="Currently selected preset",
-        default=""
-    )
-    
-    new_preset_name: bpy.props.StringProperty(
-        name="New Preset Name",
-        description="Name for saving a new preset",
-        default=""
-    )
 
-    custom_guides_data: StringProperty(
-        name="Custom Guides Data",
-        description="Serialized custom guides data for presets",
-        default="",
-        get=lambda self: serialize_guides(self.id_data.custom_guides),
-        set=lambda self, value: deserialize_guides(self.id_data.custom_guides, value),
-        options={'HIDDEN'}
-    )
+# Guide line fields that affect drawing. Changes are picked up through the
+# message bus, one subscription per field for all guides, rather than an
+# update callback on every guide item.
+_GUIDE_DRAW_PROPS = ("position_x", "position_y", "rotation", "orientation", "color")
 
+# Owner handle for message bus subscriptions
+_msgbus_owner = object()
 
-class CustomCameraGuide(PropertyGroup):
-    """Custom guide for camera - stored per camera"""
-    
-    name: bpy.props.StringProperty(
-        name="Name",
-        description="Guide name",
-        default="Guide"
-    )
-    
-    position_x: FloatProperty(
-        name="X",
-        description="Guide X position (normalized: -1=Left, 0=Center, 1=Right)",
-        default=0.0,
-        min=-1.0,
-        max=1.0,
-        step=1.0,
-        update=lambda self, context: update_3d_areas()
-    )
-    
-    position_y: FloatProperty(
-        name="Y",
-        description="Guide Y position (normalized: -1=Bottom, 0=Center, 1=Top)",
-        default=0.0,
-        min=-1.0,
-        max=1.0,
-        step=1.0,
-        update=lambda self, context: update_3d_areas()
-    )
-    
-    rotation: FloatProperty(
-        name="Rotation",
-        description="Guide rotation in degrees",
-        default=0.0,
-        unit='ROTATION',
-        update=lambda self, context: update_3d_areas()
-    )
-    
-    orientation: EnumProperty(
-        name="Orientation",
-        items=[
-            ('HORIZONTAL', "Horizontal", "Horizontal guide"),
-            ('VERTICAL', "Vertical", "Vertical guide"),
-        ],
-        default='HORIZONTAL'
-    )
-    
-    color: FloatVectorProperty(
-        name="Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(0.0, 0.4, 1.0, 0.5)
-    )
 
+def subscribe_msgbus():
+    """Subscribe redraw requests to guide line changes.
+    
+    Blender drops all subscriptions when a file is loaded, so this is also
+    called from the load_post handler.
+    """
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    for prop_name in _GUIDE_DRAW_PROPS:
+        bpy.msgbus.subscribe_rna(
+            key=(CustomGuide, prop_name),
+            owner=_msgbus_owner,
+            args=(),
+            notify=update_all_areas,
+        )
+        bpy.msgbus.subscribe_rna(
+            key=(CustomCameraGuide, prop_name),
+            owner=_msgbus_owner,
+            args=(),
+            notify=update_3d_areas,
+        )
 
-class CameraGuidesSettings(PropertyGroup):
-    """Guide settings stored per camera"""
-    
-    # Guide toggles
-    show_thirds: BoolProperty(
-        name="Rule of Thirds",
-        description="Show rule of thirds guide",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    thirds_color: FloatVectorProperty(
-        name="Thirds Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_golden: BoolProperty(
-        name="Golden Ratio",
-        description="Show golden ratio guide",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    golden_color: FloatVectorProperty(
-        name="Golden Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_center: BoolProperty(
-        name="Center Guides",
-        description="Show center cross or full crosshair",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    center_color: FloatVectorProperty(
-        name="Center Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_diagonals: BoolProperty(
-        name="Diagonals",
-        description="Show diagonal guides",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    diagonals_color: FloatVectorProperty(
-        name="Diagonals Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_golden_spiral: BoolProperty(
-        name="Golden Spiral",
-        description="Show Fibonacci/golden spiral",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    golden_spiral_flip_h: BoolProperty(
-        name="Flip Horizontal",
-        description="Flip golden spiral horizontally",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    golden_spiral_flip_v: BoolProperty(
-        name="Flip Vertical",
-        description="Flip golden spiral vertically",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    golden_spiral_length: IntProperty(
-        name="Spiral Length",
-        description="Number of spiral iterations",
-        min=1,
-        max=24,
-        default=8,
-        update=update_3d_visibility
-    )
-    
-    golden_spiral_show_segments: BoolProperty(
-        name="Show Segments",
-        description="Show subdivision squares",
-        default=True,
-        update=update_3d_visibility
-    )
-    
-    golden_spiral_fit: BoolProperty(
-        name="Fit to Frame",
-        description="Stretch spiral to fit frame boundary",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    golden_spiral_color: FloatVectorProperty(
-        name="Spiral Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_golden_triangle: BoolProperty(
-        name="Triangle",
-        description="Show golden triangle composition",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    golden_triangle_rotation: FloatProperty(
-        name="Rotation",
-        description="Rotation in degrees",
-        default=0.0,
-        unit='ROTATION',
-        update=update_3d_visibility
-    )
-    
-    golden_triangle_scale: FloatProperty(
-        name="Scale",
-        description="Scale of the triangle (0.1 to 2.0)",
-        min=0.1,
-        max=2.0,
-        default=1.0,
-        update=update_3d_visibility
-    )
-    
-    golden_triangle_count: IntProperty(
-        name="Triangle Count",
-        description="Number of nested triangles",
-        min=1,
-        max=10,
-        default=1,
-        update=update_3d_visibility
-    )
-    
-    golden_triangle_color: FloatVectorProperty(
-        name="Triangle Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_radial_symmetry: BoolProperty(
-        name="Radial Symmetry",
-        description="Show radial symmetry lines",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    radial_symmetry_color: FloatVectorProperty(
-        name="Radial Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    radial_line_count: IntProperty(
-        name="Line Count",
-        description="Number of radial symmetry lines",
-        min=2,
-        max=32,
-        default=8,
-        update=update_3d_visibility
-    )
-    
-    show_vanishing_point: BoolProperty(
-        name="Vanishing Point Grid",
-        description="Show perspective vanishing point grid",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    vanishing_point_color: FloatVectorProperty(
-        name="VP Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    vanishing_point_x: FloatProperty(
-        name="VP X Position",
-        description="Vanishing point X position (0-1)",
-        min=0.0,
-        max=1.0,
-        default=0.5,
-        update=update_3d_visibility
-    )
-    
-    vanishing_point_y: FloatProperty(
-        name="VP Y Position",
-        description="Vanishing point Y position (0-1)",
-        min=0.0,
-        max=1.0,
-        default=0.5,
-        update=update_3d_visibility
-    )
-    
-    vanishing_point_lines: IntProperty(
-        name="Line Count",
-        description="Subdivisions per edge (1=corners only, 2=+midpoints, etc.)",
-        min=1,
-        max=16,
-        default=1,
-        update=update_3d_visibility
-    )
-    
-    show_vanishing_point_grid: BoolProperty(
-        name="Show Grid",
-        description="Show perspective grid lines",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    vanishing_point_grid_count: IntProperty(
-        name="Grid Count",
-        description="Number of perspective grid lines",
-        min=2,
-        max=64,
-        default=10,
-        update=update_3d_visibility
-    )
-    
-    show_circular_thirds: BoolProperty(
-        name="Circular",
-        description="Show circular/concentric rule of thirds",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    circular_thirds_count: IntProperty(
-        name="Circle Count",
-        description="Number of concentric circles",
-        min=1,
-        max=10,
-        default=3,
-        update=update_3d_visibility
-    )
-    
-    circular_thirds_fit: BoolProperty(
-        name="Fit to Frame",
-        description="Stretch circles to fit frame boundary (creates ellipses)",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    circular_thirds_color: FloatVectorProperty(
-        name="Circular Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_diagonal_reciprocals: BoolProperty(
-        name="Diagonal Reciprocals",
-        description="Show diagonal reciprocal composition guides",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    diagonal_reciprocals_color: FloatVectorProperty(
-        name="Diagonal Reciprocals Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    show_harmony_triangles: BoolProperty(
-        name="Golden Triangle",
-        description="Show harmony triangle composition guides",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    harmony_triangles_color: FloatVectorProperty(
-        name="Golden Triangle Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    harmony_triangles_flip: BoolProperty(
-        name="Flip",
-        description="Flip harmony triangles",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    show_diagonal_method: BoolProperty(
-        name="Diagonal Method",
-        description="Show 45-degree diagonal lines from corners",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    diagonal_method_color: FloatVectorProperty(
-        name="Diagonal Method Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.5),
-        update=update_3d_visibility
-    )
-    
-    diagonal_method_angle: FloatProperty(
-        name="Angle",
-        description="Angle of diagonal lines",
-        default=45.0,
-        min=0.0,
-        max=90.0,
-        update=update_3d_visibility
-    )
-    
-    # Ruler settings
-    show_rulers: BoolProperty(
-        name="Show Rulers",
-        description="Show rulers with measurements",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    ruler_units: EnumProperty(
-        name="Units",
-        description="Ruler measurement units",
-        items=[
-            ('RESOLUTION', "Resolution", "Show measurements in resolution pixels"),
-            ('PIXELS', "Pixels", "Show measurements in display pixels"),
-            ('PERCENT', "Percentage", "Show measurements as percentage"),
-        ],
-        default='RESOLUTION',
-        update=update_3d_visibility
-    )
-    
-    ruler_color: FloatVectorProperty(
-        name="Ruler Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.8),
-        update=update_3d_visibility
-    )
-    
-    line_width: FloatProperty(
-        name="Line Width",
-        description="Width of guide lines",
-        min=0.5,
-        max=5.0,
-        default=1.0,
-        update=update_3d_visibility
-    )
-    
-    ruler_size: IntProperty(
-        name="Ruler Size",
-        description="Height/width of ruler bars",
-        min=20,
-        max=50,
-        default=30,
-        update=update_3d_visibility
-    )
-    
-    bg_color: FloatVectorProperty(
-        name="BG Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(0.16, 0.16, 0.16, 0.96),
-        update=update_3d_visibility
-    )
-    
-    # Grid settings
-    show_grid: BoolProperty(
-        name="Grid",
-        description="Show grid overlay",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    grid_divisions: IntProperty(
-        name="Grid Divisions",
-        description="Number of grid divisions",
-        min=2,
-        max=32,
-        default=8,
-        update=update_3d_visibility
-    )
-    
-    grid_square: BoolProperty(
-        name="Square Grid",
-        description="Force square grid cells (equal width and height)",
-        default=False,
-        update=update_3d_visibility
-    )
-    
-    grid_color: FloatVectorProperty(
-        name="Grid Color",
-        subtype='COLOR',
-        size=4,
-        min=0.0,
-        max=1.0,
-        default=(1.0, 1.0, 1.0, 0.3),
-        update=update_3d_visibility
-    )
-    
-    # Guide Lines
-    show_custom_guides: BoolProperty(
-        name="Guide Lines",
-        description="Show guide lines",
-        default=True,
-        update=update_3d_visibility
-    )
-    
-    active_guide_index: IntProperty(
-        name="Active Guide",
-        description="Active custom guide index",
-        default=0
-    )
-    
-    # Frame clipping
-    hide_guides_outside_frame: BoolProperty(
-        name="Hide Guides Outside Frame",
-        description="Hide guide lines that extend outside the frame boundaries",
-        default=True,
-        update=update_3d_visibility
-    )
-    
-    # Internal storage for toggle state
-    stored_active_guides: bpy.props.StringProperty(
-        default=""
-    )
-    
-    # Preset management
-    active_preset: bpy.props.StringProperty(
-        name="Active Preset",
-        description="Currently selected preset",
-        default=""
-    )
-    
-    new_preset_name: bpy.props.StringProperty(
-        name="New Preset Name",
-        description="Name for saving a new preset",
-        default=""
-    )
 
-    custom_guides_data: StringProperty(
-        name="Custom Guides Data",
-        description="Serialized custom guides data for presets",
-        default="",
-        get=lambda self: serialize_guides(self.id_data.custom_camera_guides),
-        set=lambda self, value: deserialize_guides(self.id_data.custom_camera_guides, value),
-        options={'HIDDEN'}
-    )
+def unsubscribe_msgbus():
+    """Remove all message bus subscriptions owned by the addon."""
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
 
 
 # Registration
@@ -1210,33 +1055,63 @@ classes = (
     CameraGuidesSettings,
 )
 
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(classes)
+
+
+# (owner type, attribute) of every property added by register(), in order
+_registered_props = []
+
 
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-    
-    # VSE settings (on Scene)
-    bpy.types.Scene.vse_guides = bpy.props.PointerProperty(type=VSEGuidesSettings)
-    bpy.types.Scene.custom_guides = bpy.props.CollectionProperty(type=CustomGuide)
-    
-    # Camera settings (on Camera data)
-    bpy.types.Camera.camera_guides = bpy.props.PointerProperty(type=CameraGuidesSettings)
-    bpy.types.Camera.custom_camera_guides = bpy.props.CollectionProperty(type=CustomCameraGuide)
+    try:
+        _register_classes()
+    except ValueError:
+        # register() ran again without unregister() in between (e.g. a
+        # development reload); tear down the previous registration first
+        unregister()
+        _register_classes()
+    
+    for owner, name, prop in (
+        # VSE settings (on Scene)
+        (bpy.types.Scene, 'vse_guides', bpy.props.PointerProperty(type=VSEGuidesSettings)),
+        (bpy.types.Scene, 'custom_guides', bpy.props.CollectionProperty(type=CustomGuide)),
+        # Camera settings (on Camera data)
+        (bpy.types.Camera, 'camera_guides', bpy.props.PointerProperty(type=CameraGuidesSettings)),
+        (bpy.types.Camera, 'custom_camera_guides', bpy.props.CollectionProperty(type=CustomCameraGuide)),
+    ):
+        setattr(owner, name, prop)
+        _registered_props.append((owner, name))
+    
+    subscribe_msgbus()
+    
+    bpy.app.handlers.undo_post.append(_undo_redo_handler)
+    bpy.app.handlers.redo_post.append(_undo_redo_handler)
+    bpy.app.handlers.frame_change_post.append(_frame_change_handler)
+    bpy.app.handlers.depsgraph_update_post.append(_depsgraph_update_handler)
 
 
 def unregister():
-    # Camera settings
-    if hasattr(bpy.types.Camera, 'camera_guides'):
-        del bpy.types.Camera.camera_guides
-    if hasattr(bpy.types.Camera, 'custom_camera_guides'):
-        del bpy.types.Camera.custom_camera_guides
-    
-    # VSE settings
-    if hasattr(bpy.types.Scene, 'vse_guides'):
-        del bpy.types.Scene.vse_guides
-    if hasattr(bpy.types.Scene, 'custom_guides'):
-        del bpy.types.Scene.custom_guides
-    
-    for cls in reversed(classes):
-        bpy.utils.unregister_class(cls)
+    unsubscribe_msgbus()
+    
+    if _undo_redo_handler in bpy.app.handlers.undo_post:
+        bpy.app.handlers.undo_post.remove(_undo_redo_handler)
+    if _undo_redo_handler in bpy.app.handlers.redo_post:
+        bpy.app.handlers.redo_post.remove(_undo_redo_handler)
+    if _frame_change_handler in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(_frame_change_handler)
+    if _depsgraph_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(_depsgraph_update_handler)
+    invalidate_enabled_guides()
+    
+    # Drop any redraw flush still waiting to run
+    if bpy.app.timers.is_registered(_flush_redraws):
+        bpy.app.timers.unregister(_flush_redraws)
+    _dirty.clear()
+    
+    # Remove the properties added by register(), newest first
+    while _registered_props:
+        owner, name = _registered_props.pop()
+        delattr(owner, name)
+    
+    _unregister_classes()
 
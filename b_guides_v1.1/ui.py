@@ -2,7 +2,22 @@
 
 import bpy
 from bpy.types import Panel, UIList
-from . import presets
+from .properties import get_enabled_guides
+
+# Sequencer view types that show the preview, where the guides are drawn
+PREVIEW_VIEW_TYPES = frozenset({'PREVIEW', 'SEQUENCER_PREVIEW'})
+
+# List icon for each guide orientation
+ORIENTATION_ICONS = {
+    'HORIZONTAL': 'TRIA_DOWN',
+    'VERTICAL': 'TRIA_RIGHT',
+}
+
+
+def any_guides_active(settings):
+    """Check if any guide of a settings group is enabled."""
+    # Cached per settings group and refreshed when a toggle changes
+    return bool(get_enabled_guides(settings))
 
 
 def draw_preset_section(layout, settings):
@@ -22,11 +37,11 @@ class VSE_UL_custom_guides(UIList):
     def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
         guide = item
         
+        # Icon based on orientation
+        icon = ORIENTATION_ICONS[guide.orientation]
+        
         if self.layout_type in {'DEFAULT', 'COMPACT'}:
             row = layout.row(align=True)
-            
-            # Icon based on orientation
-            icon = 'TRIA_DOWN' if guide.orientation == 'HORIZONTAL' else 'TRIA_RIGHT'
             row.label(text="", icon=icon)
             
             # Guide name
@@ -37,10 +52,244 @@ class VSE_UL_custom_guides(UIList):
             
         elif self.layout_type == 'GRID':
             layout.alignment = 'CENTER'
-            icon = 'TRIA_DOWN' if guide.orientation == 'HORIZONTAL' else 'TRIA_RIGHT'
             layout.label(text="", icon=icon)
 
 
+def draw_guides_settings(layout, settings):
+    """Draw the controls above the guide subpanels."""
+    # Toggle all guides button at top
+    any_active = any_guides_active(settings)
+    row = layout.row()
+    row.scale_y = 1.2
+    row.operator(
+        "vse.toggle_all_guides",
+        text="All Guides ON" if not any_active else "All Guides OFF",
+        icon='HIDE_OFF' if any_active else 'HIDE_ON',
+        depress=any_active
+    )
+    layout.separator()
+
+    # Presets section
+    draw_preset_section(layout, settings)
+
+
+def get_panel_guides(context):
+    """Return (settings, guides_owner, guides_prop) for the editor, or None.
+    
+    ``guides_owner.guides_prop`` is the collection of guide lines (scene
+    for the VSE, camera data for the 3D Viewport).
+    """
+    scene = context.scene
+    if context.space_data.type == 'SEQUENCE_EDITOR':
+        return scene.vse_guides, scene, "custom_guides"
+    
+    # Every Camera datablock has guide settings while the addon is
+    # registered, so checking the object type is enough
+    camera = scene.camera
+    if camera is None or camera.type != 'CAMERA':
+        return None
+    camera_data = camera.data
+    return camera_data.camera_guides, camera_data, "custom_camera_guides"
+
+
+def draw_golden_spiral_options(col, settings):
+    row = col.row(align=True)
+    row.prop(settings, "golden_spiral_flip_h", text="Flip H", toggle=True)
+    row.prop(settings, "golden_spiral_flip_v", text="Flip V", toggle=True)
+    sub_col = col.column(align=True)
+    sub_col.prop(settings, "golden_spiral_length")
+    row = sub_col.row(align=True)
+    row.prop(settings, "golden_spiral_show_segments")
+    row.prop(settings, "golden_spiral_fit")
+
+
+def draw_golden_triangle_options(col, settings):
+    row = col.row(align=True)
+    row.prop(settings, "golden_triangle_rotation")
+    row = col.row(align=True)
+    row.prop(settings, "golden_triangle_scale")
+    row.prop(settings, "golden_triangle_count")
+
+
+def draw_circular_thirds_options(col, settings):
+    row = col.row(align=True)
+    row.prop(settings, "circular_thirds_count", text="Circles")
+    row.prop(settings, "circular_thirds_fit")
+
+
+def draw_radial_symmetry_options(col, settings):
+    col.prop(settings, "radial_line_count", text="Lines")
+
+
+def draw_vanishing_point_options(col, settings):
+    row = col.row(align=True)
+    row.prop(settings, "vanishing_point_x", text="VP X", slider=True)
+    row.prop(settings, "vanishing_point_y", text="VP Y", slider=True)
+    row = col.row(align=True)
+    row.prop(settings, "vanishing_point_lines")
+    row.prop(settings, "show_vanishing_point_grid")
+    if settings.show_vanishing_point_grid:
+        col.prop(settings, "vanishing_point_grid_count")
+
+
+def draw_harmony_triangles_options(col, settings):
+    col.prop(settings, "harmony_triangles_flip", toggle=True)
+
+
+def draw_diagonal_method_options(col, settings):
+    col.prop(settings, "diagonal_method_angle")
+
+
+# Rows of the Guides subpanel: (toggle, color, icon, options drawn while
+# enabled). None adds a separator between groups.
+COMPOSITION_GUIDE_ROWS = (
+    ("show_thirds", "thirds_color", 'SNAP_GRID', None),
+    ("show_golden", "golden_color", 'MESH_GRID', None),
+    None,
+    ("show_center", "center_color", 'ADD', None),
+    ("show_diagonals", "diagonals_color", 'X', None),
+    None,
+    ("show_golden_spiral", "golden_spiral_color", 'FORCE_VORTEX', draw_golden_spiral_options),
+    ("show_golden_triangle", "golden_triangle_color", 'MARKER', draw_golden_triangle_options),
+    None,
+    ("show_circular_thirds", "circular_thirds_color", 'MESH_CIRCLE', draw_circular_thirds_options),
+    ("show_radial_symmetry", "radial_symmetry_color", 'ORIENTATION_LOCAL', draw_radial_symmetry_options),
+    None,
+    ("show_vanishing_point", "vanishing_point_color", 'OUTLINER_DATA_LIGHTPROBE', draw_vanishing_point_options),
+    None,
+    ("show_diagonal_reciprocals", "diagonal_reciprocals_color", 'MESH_ICOSPHERE', None),
+    ("show_harmony_triangles", "harmony_triangles_color", 'MOD_DECIM', draw_harmony_triangles_options),
+    ("show_diagonal_method", "diagonal_method_color", 'DRIVER_DISTANCE', draw_diagonal_method_options),
+)
+
+
+class GuidesSubPanel:
+    """Common part of the guide subpanels.
+    
+    Each section is its own subpanel so Blender skips drawing it while
+    it is collapsed. ``toggle`` is the setting shown as header checkbox;
+    the section body is only drawn while it is enabled. ``icon`` is drawn
+    in the header next to the label.
+    """
+    bl_region_type = 'UI'
+    bl_category = "Guides"
+    toggle = None
+    icon = 'NONE'
+    
+    @classmethod
+    def poll(cls, context):
+        return get_panel_guides(context) is not None
+    
+    def draw_header(self, context):
+        if self.toggle:
+            settings = get_panel_guides(context)[0]
+            self.layout.prop(settings, self.toggle, text="")
+        self.layout.label(icon=self.icon)
+    
+    def draw(self, context):
+        settings, guides_owner, guides_prop = get_panel_guides(context)
+        if self.toggle and not getattr(settings, self.toggle):
+            return
+        self.draw_section(self.layout, settings, guides_owner, guides_prop)
+
+
+class GuidesGridPanel(GuidesSubPanel):
+    bl_label = "Grid"
+    toggle = "show_grid"
+    icon = 'VIEW_ORTHO'
+    
+    def draw_section(self, layout, settings, guides_owner, guides_prop):
+        col = layout.column(align=True)
+        col.prop(settings, "grid_divisions")
+        row = col.row()
+        row.prop(settings, "grid_square")
+        row.prop(settings, "grid_color", text="")
+
+
+class GuidesLinesPanel(GuidesSubPanel):
+    bl_label = "Guide Lines"
+    toggle = "show_custom_guides"
+    icon = 'MOD_MULTIRES'
+    
+    def draw_section(self, layout, settings, guides_owner, guides_prop):
+        col = layout.column(align=True)
+        col.operator("vse.add_custom_guide", text="Add Line", icon='ADD')
+        
+        custom_guides = getattr(guides_owner, guides_prop)
+        guide_count = len(custom_guides)
+        if guide_count > 0:
+            col.separator()
+            row = col.row()
+            row.label(text=f"Lines ({guide_count})", icon='LINENUMBERS_ON')
+            row.operator("vse.clear_custom_guides", text="", icon='TRASH')
+            
+            row = col.row()
+            row.template_list(
+                "VSE_UL_custom_guides",
+                "",
+                guides_owner,
+                guides_prop,
+                settings,
+                "active_guide_index",
+                rows=3,
+                maxrows=8
+            )
+            
+            active_index = settings.active_guide_index
+            col_ops = row.column(align=True)
+            col_ops.operator("vse.remove_custom_guide", text="", icon='REMOVE').index = active_index
+            
+            if 0 <= active_index < guide_count:
+                active_guide = custom_guides[active_index]
+                col.separator()
+                box = col.box()
+                row = box.row()
+                row.label(text="Transform", icon='OBJECT_ORIGIN')
+                col_props = box.column(align=True)
+                row = col_props.row(align=True)
+                row.prop(active_guide, "position_x", text="X")
+                row.prop(active_guide, "position_y", text="Y")
+                col_props.separator()
+                row = col_props.row(align=True)
+                row.prop(active_guide, "rotation", text="Rotation")
+
+
+class GuidesCompositionPanel(GuidesSubPanel):
+    bl_label = "Guides"
+    icon = 'PIVOT_CURSOR'
+    
+    def draw_section(self, layout, settings, guides_owner, guides_prop):
+        col = layout.column(align=True)
+        for guide_row in COMPOSITION_GUIDE_ROWS:
+            if guide_row is None:
+                col.separator(factor=0.5)
+                continue
+            toggle, color, icon, draw_options = guide_row
+            row = col.row(align=True)
+            row.prop(settings, toggle, icon=icon)
+            row.prop(settings, color, text="")
+            if draw_options is not None and getattr(settings, toggle):
+                draw_options(col, settings)
+        
+        col.separator()
+        col.prop(settings, "line_width")
+
+
+class GuidesRulerPanel(GuidesSubPanel):
+    bl_label = "Ruler"
+    toggle = "show_rulers"
+    icon = 'ARROW_LEFTRIGHT'
+    
+    def draw_section(self, layout, settings, guides_owner, guides_prop):
+        col = layout.column(align=True)
+        row = col.row()
+        row.prop(settings, "ruler_units")
+        row.prop(settings, "ruler_size")
+        row = col.row()
+        row.prop(settings, "ruler_color")
+        row.prop(settings, "bg_color", text=" BG Color")
+
+
 class VIEW3D_PT_composition_guides(Panel):
     """Creates a Panel in the 3D Viewport sidebar"""
     bl_label = "Composition Guides"
@@ -71,218 +320,12 @@ class VIEW3D_PT_composition_guides(Panel):
             layout.separator()
         
         # Use camera settings
-        if hasattr(camera.data, 'camera_guides'):
-            settings = camera.data.camera_guides
-            custom_guides = camera.data.custom_camera_guides
-        else:
+        guides = get_panel_guides(context)
+        if guides is None:
             layout.label(text="Select a Camera", icon='INFO')
             return
         
-        # Toggle all guides button at top
-        any_active = self.any_guides_active(settings)
-        row = layout.row()
-        row.scale_y = 1.2
-        row.operator(
-            "vse.toggle_all_guides",
-            text="All Guides ON" if not any_active else "All Guides OFF",
-            icon='HIDE_OFF' if any_active else 'HIDE_ON',
-            depress=any_active
-        )
-        layout.separator()
-
-        # Presets section at bottom
-        draw_preset_section(layout, settings)
-        layout.separator()
-
-        # Grid
-        box = layout.box()
-        row = box.row()
-        row.label(text="Grid", icon='VIEW_ORTHO')
-        row.prop(settings, "show_grid", text="")
-        if settings.show_grid:
-            col = box.column(align=True)
-            col.prop(settings, "grid_divisions")
-            row = col.row()
-            row.prop(settings, "grid_square")
-            row.prop(settings, "grid_color", text="")
-        
-        # Guide Lines
-        box = layout.box()
-        row = box.row()
-        row.label(text="Guide Lines", icon='MOD_MULTIRES')
-        row.prop(settings, "show_custom_guides", text="")
-        
-        if settings.show_custom_guides:
-            col = box.column(align=True)
-            col.operator("vse.add_custom_guide", text="Add Line", icon='ADD')
-            
-            if len(custom_guides) > 0:
-                col.separator()
-                row = col.row()
-                row.label(text=f"Lines ({len(custom_guides)})")
-                row.operator("vse.clear_custom_guides", text="", icon='TRASH')
-                
-                row = col.row()
-                row.template_list(
-                    "VSE_UL_custom_guides",
-                    "",
-                    camera.data,
-                    "custom_camera_guides",
-                    settings,
-                    "active_guide_index",
-                    rows=min(len(custom_guides), 5)
-                )
-                
-                col_ops = row.column(align=True)
-                col_ops.operator("vse.remove_custom_guide", text="", icon='REMOVE').index = settings.active_guide_index
-                
-                if 0 <= settings.active_guide_index < len(custom_guides):
-                    active_guide = custom_guides[settings.active_guide_index]
-                    col.separator()
-                    box = col.box()
-                    row = box.row()
-                    row.label(text="Transform", icon='OBJECT_ORIGIN')
-                    col_props = box.column(align=True)
-                    row = col_props.row(align=True)
-                    row.prop(active_guide, "position_x", text="X")
-                    row.prop(active_guide, "position_y", text="Y")
-                    col_props.separator()
-                    row = col_props.row(align=True)
-                    row.prop(active_guide, "rotation", text="Rotation")
-        
-        # Composition Guides
-        box = layout.box()
-        box.label(text="Guides", icon='PIVOT_CURSOR')
-        col = box.column(align=True)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_thirds", icon='SNAP_GRID')
-        row.prop(settings, "thirds_color", text="")
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_golden", icon='MESH_GRID')
-        row.prop(settings, "golden_color", text="")
-        
-        col.separator(factor=0.5)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_center", icon='ADD')
-        row.prop(settings, "center_color", text="")
-        row = col.row(align=True)
-        row.prop(settings, "show_diagonals", icon='X')
-        row.prop(settings, "diagonals_color", text="")
-        
-        col.separator(factor=0.5)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_golden_spiral", icon='FORCE_VORTEX')
-        row.prop(settings, "golden_spiral_color", text="")
-        if settings.show_golden_spiral:
-            row = col.row(align=True)
-            row.prop(settings, "golden_spiral_flip_h", text="Flip H", toggle=True)
-            row.prop(settings, "golden_spiral_flip_v", text="Flip V", toggle=True)
-            sub_col = col.column(align=True)
-            sub_col.prop(settings, "golden_spiral_length")
-            row = sub_col.row(align=True)
-            row.prop(settings, "golden_spiral_show_segments")
-            row.prop(settings, "golden_spiral_fit")
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_golden_triangle", icon='MARKER')
-        row.prop(settings, "golden_triangle_color", text="")
-        if settings.show_golden_triangle:
-            row = col.row(align=True)
-            row.prop(settings, "golden_triangle_rotation")
-            row = col.row(align=True)
-            row.prop(settings, "golden_triangle_scale")
-            row.prop(settings, "golden_triangle_count")
-        
-        col.separator(factor=0.5)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_circular_thirds", icon='MESH_CIRCLE')
-        row.prop(settings, "circular_thirds_color", text="")
-        if settings.show_circular_thirds:
-            row = col.row(align=True)
-            row.prop(settings, "circular_thirds_count", text="Circles")
-            row.prop(settings, "circular_thirds_fit")
-        row = col.row(align=True)
-        row.prop(settings, "show_radial_symmetry", icon='ORIENTATION_LOCAL')
-        row.prop(settings, "radial_symmetry_color", text="")
-        if settings.show_radial_symmetry:
-            col.prop(settings, "radial_line_count", text="Lines")
-        
-        col.separator(factor=0.5)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_vanishing_point", icon='OUTLINER_DATA_LIGHTPROBE')
-        row.prop(settings, "vanishing_point_color", text="")
-        if settings.show_vanishing_point:
-            row = col.row(align=True)
-            row.prop(settings, "vanishing_point_x", text="VP X", slider=True)
-            row.prop(settings, "vanishing_point_y", text="VP Y", slider=True)
-            row = col.row(align=True)
-            row.prop(settings, "vanishing_point_lines")
-            row.prop(settings, "show_vanishing_point_grid")
-            if settings.show_vanishing_point_grid:
-                col.prop(settings, "vanishing_point_grid_count")
-        
-        col.separator(factor=0.5)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_diagonal_reciprocals", icon='MESH_ICOSPHERE')
-        row.prop(settings, "diagonal_reciprocals_color", text="")
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_harmony_triangles", icon='MOD_DECIM')
-        row.prop(settings, "harmony_triangles_color", text="")
-        if settings.show_harmony_triangles:
-            col.prop(settings, "harmony_triangles_flip", toggle=True)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_diagonal_method", icon='DRIVER_DISTANCE')
-        row.prop(settings, "diagonal_method_color", text="")
-        if settings.show_diagonal_method:
-            col.prop(settings, "diagonal_method_angle")
-        
-        col.separator()
-        col.prop(settings, "line_width")
-        col.separator()
-        
-        # Ruler & Display settings
-        box = layout.box()
-        row = box.row()
-        row.label(text="Ruler", icon='ARROW_LEFTRIGHT')
-        row.prop(settings, "show_rulers", text="")
-
-        if settings.show_rulers:
-            col = box.column(align=True)
-            row = col.row()
-            row.prop(settings, "ruler_units")
-            row.prop(settings, "ruler_size")
-            row = col.row()
-            row.prop(settings, "ruler_color")
-            row.prop(settings, "bg_color", text=" BG Color")
-        
-    
-    def any_guides_active(self, settings):
-        return any([
-            settings.show_thirds,
-            settings.show_golden,
-            settings.show_center,
-            settings.show_diagonals,
-            settings.show_rulers,
-            settings.show_grid,
-            settings.show_custom_guides,
-            settings.show_golden_spiral,
-            settings.show_golden_triangle,
-            settings.show_circular_thirds,
-            settings.show_radial_symmetry,
-            settings.show_vanishing_point,
-            settings.show_diagonal_reciprocals,
-            settings.show_harmony_triangles,
-            settings.show_diagonal_method
-        ])
+        draw_guides_settings(layout, guides[0])
 
 
 class VSE_PT_composition_guides(Panel):
@@ -296,266 +339,70 @@ class VSE_PT_composition_guides(Panel):
     @classmethod
     def poll(cls, context):
         # Show panel in both Preview-only and Sequencer+Preview modes
-        return context.space_data.view_type in {'PREVIEW', 'SEQUENCER_PREVIEW'}
+        return context.space_data.view_type in PREVIEW_VIEW_TYPES
     
     def draw(self, context):
-        layout = self.layout
-        settings = context.scene.vse_guides
+        draw_guides_settings(self.layout, context.scene.vse_guides)
 
-        # Toggle all guides button at top
-        any_active = self.any_guides_active(settings)
-        row = layout.row()
-        row.scale_y = 1.2
-        row.operator(
-            "vse.toggle_all_guides",
-            text="All Guides ON" if not any_active else "All Guides OFF",
-            icon='HIDE_OFF' if any_active else 'HIDE_ON',
-            depress=any_active
-        )
-        layout.separator()
-        # Presets section at bottom
-        draw_preset_section(layout, settings)
-        layout.separator()
-        # Grid
-        box = layout.box()
-        row = box.row()
-        row.label(text="Grid", icon='VIEW_ORTHO')
-        row.prop(settings, "show_grid", text="")
-        if settings.show_grid:
-            col = box.column(align=True)
-            col.prop(settings, "grid_divisions")
-            row = col.row()
-            row.prop(settings, "grid_square")
-            row.prop(settings, "grid_color", text="")       
-        # Guide Lines
-        box = layout.box()
-        row = box.row()
-        row.label(text="Guide Lines", icon='MOD_MULTIRES')
-        row.prop(settings, "show_custom_guides", text="")
-        
-        if settings.show_custom_guides:
-            col = box.column(align=True)
-            
-            # Single add button
-            col.operator("vse.add_custom_guide", text="Add Line", icon='ADD')
-            
-            if len(context.scene.custom_guides) > 0:
-                col.separator()
-                
-                # Header with count and clear button
-                row = col.row()
-                row.label(text=f"Lines ({len(context.scene.custom_guides)})", icon='LINENUMBERS_ON')
-                row.operator("vse.clear_custom_guides", text="", icon='TRASH')
-                
-                # UIList for guides
-                row = col.row()
-                row.template_list(
-                    "VSE_UL_custom_guides",
-                    "",
-                    context.scene,
-                    "custom_guides",
-                    settings,
-                    "active_guide_index",
-                    rows=min(len(context.scene.custom_guides), 5),
-                    maxrows=8
-                )
-                
-                # List operations
-                col_ops = row.column(align=True)
-                col_ops.operator("vse.remove_custom_guide", text="", icon='REMOVE').index = settings.active_guide_index
-                
-                # Active guide properties
-                if 0 <= settings.active_guide_index < len(context.scene.custom_guides):
-                    active_guide = context.scene.custom_guides[settings.active_guide_index]
-                    
-                    col.separator()
-                    
-                    # Location & Rotation in a unified block
-                    box = col.box()
-                    
-                    # Header
-                    row = box.row()
-                    row.label(text="Transform", icon='OBJECT_ORIGIN')
-                    
-                    # X/Y Properties
-                    col_props = box.column(align=True)
-                    
-                    row = col_props.row(align=True)
-                    row.prop(active_guide, "position_x", text="X")
-                    row.prop(active_guide, "position_y", text="Y")
-                    
-                    col_props.separator()
-                    
-                    # Rotation
-                    row = col_props.row(align=True)
-                    row.prop(active_guide, "rotation", text="Rotation")
-        
-        # Composition Guides
-        box = layout.box()
-        box.label(text="Guides", icon='PIVOT_CURSOR')
-        col = box.column(align=True)
-        
-        # Classic guides
-        row = col.row(align=True)
-        row.prop(settings, "show_thirds", icon='SNAP_GRID')
-        row.prop(settings, "thirds_color", text="")
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_golden", icon='MESH_GRID')
-        row.prop(settings, "golden_color", text="")
-        
-        col.separator(factor=0.5)
-        
-        # Center and alignment
-        row = col.row(align=True)
-        row.prop(settings, "show_center", icon='ADD')
-        row.prop(settings, "center_color", text="")
-        row = col.row(align=True)
-        row.prop(settings, "show_diagonals", icon='X')
-        row.prop(settings, "diagonals_color", text="")
-        
-        col.separator(factor=0.5)
 
-        row = col.row(align=True)
-        row.prop(settings, "show_golden_spiral", icon='FORCE_VORTEX')
-        row.prop(settings, "golden_spiral_color", text="")
-        if settings.show_golden_spiral:
-            row = col.row(align=True)
-            row.prop(settings, "golden_spiral_flip_h", text="Flip H", toggle=True)
-            row.prop(settings, "golden_spiral_flip_v", text="Flip V", toggle=True)
-            sub_col = col.column(align=True)
-            sub_col.prop(settings, "golden_spiral_length")
-            row = sub_col.row(align=True)
-            row.prop(settings, "golden_spiral_show_segments")
-            row.prop(settings, "golden_spiral_fit")
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_golden_triangle", icon='MARKER')
-        row.prop(settings, "golden_triangle_color", text="")
-        if settings.show_golden_triangle:
-            row = col.row(align=True)
-            row.prop(settings, "golden_triangle_rotation")
-            row = col.row(align=True)
-            row.prop(settings, "golden_triangle_scale")
-            row.prop(settings, "golden_triangle_count")
-        
-        col.separator(factor=0.5)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_circular_thirds", icon='MESH_CIRCLE')
-        row.prop(settings, "circular_thirds_color", text="")
-        if settings.show_circular_thirds:
-            row = col.row(align=True)
-            row.prop(settings, "circular_thirds_count", text="Circles")
-            row.prop(settings, "circular_thirds_fit")
-        row = col.row(align=True)
-        row.prop(settings, "show_radial_symmetry", icon='ORIENTATION_LOCAL')
-        row.prop(settings, "radial_symmetry_color", text="")
-        if settings.show_radial_symmetry:
-            col.prop(settings, "radial_line_count", text="Lines")
-        
-        col.separator(factor=0.5)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_vanishing_point", icon='OUTLINER_DATA_LIGHTPROBE')
-        row.prop(settings, "vanishing_point_color", text="")
-        if settings.show_vanishing_point:
-            row = col.row(align=True)
-            row.prop(settings, "vanishing_point_x", text="VP X", slider=True)
-            row.prop(settings, "vanishing_point_y", text="VP Y", slider=True)
-            row = col.row(align=True)
-            row.prop(settings, "vanishing_point_lines")
-            row.prop(settings, "show_vanishing_point_grid")
-            if settings.show_vanishing_point_grid:
-                col.prop(settings, "vanishing_point_grid_count")
-        
-        col.separator(factor=0.5)
-        
-        # Advanced diagonal guides
-        row = col.row(align=True)
-        row.prop(settings, "show_diagonal_reciprocals", icon='MESH_ICOSPHERE')
-        row.prop(settings, "diagonal_reciprocals_color", text="")
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_harmony_triangles", icon='MOD_DECIM')
-        row.prop(settings, "harmony_triangles_color", text="")
-        if settings.show_harmony_triangles:
-            col.prop(settings, "harmony_triangles_flip", toggle=True)
-        
-        row = col.row(align=True)
-        row.prop(settings, "show_diagonal_method", icon='DRIVER_DISTANCE')
-        row.prop(settings, "diagonal_method_color", text="")
-        if settings.show_diagonal_method:
-            col.prop(settings, "diagonal_method_angle")
-        
-        col.separator(factor=0.5)
+class VIEW3D_PT_guides_grid(GuidesGridPanel, Panel):
+    bl_idname = "VIEW3D_PT_guides_grid"
+    bl_space_type = 'VIEW_3D'
+    bl_parent_id = "VIEW3D_PT_composition_guides"
 
 
-        col.prop(settings, "line_width")
-        col.separator()        
-        
-        # Ruler & Display settings
-        box = layout.box()
-        row = box.row()
-        row.label(text="Ruler", icon='ARROW_LEFTRIGHT')
-        row.prop(settings, "show_rulers", text="")
-
-        if settings.show_rulers:
-            col = box.column(align=True)
-            row = col.row()
-            row.prop(settings, "ruler_units")
-            row.prop(settings, "ruler_size")
-            row = col.row()
-            row.prop(settings, "ruler_color")
-            row.prop(settings, "bg_color", text=" BG Color")
+class VIEW3D_PT_guides_lines(GuidesLinesPanel, Panel):
+    bl_idname = "VIEW3D_PT_guides_lines"
+    bl_space_type = 'VIEW_3D'
+    bl_parent_id = "VIEW3D_PT_composition_guides"
+
+
+class VIEW3D_PT_guides_composition(GuidesCompositionPanel, Panel):
+    bl_idname = "VIEW3D_PT_guides_composition"
+    bl_space_type = 'VIEW_3D'
+    bl_parent_id = "VIEW3D_PT_composition_guides"
+
+
+class VIEW3D_PT_guides_ruler(GuidesRulerPanel, Panel):
+    bl_idname = "VIEW3D_PT_guides_ruler"
+    bl_space_type = 'VIEW_3D'
+    bl_parent_id = "VIEW3D_PT_composition_guides"
 
-    
-    def any_guides_active(self, settings):
-        return any([
-            settings.show_thirds,
-            settings.show_golden,
-            settings.show_center,
-            settings.show_diagonals,
-            settings.show_rulers,
-            settings.show_grid,
-            settings.show_custom_guides,
-            settings.show_golden_spiral,
-            settings.show_golden_triangle,
-            settings.show_circular_thirds,
-            settings.show_radial_symmetry,
-            settings.show_vanishing_point,
-            settings.show_diagonal_reciprocals,
-            settings.show_harmony_triangles,
-            settings.show_diagonal_method
-        ])
+
+class VSE_PT_guides_grid(GuidesGridPanel, Panel):
+    bl_idname = "VSE_PT_guides_grid"
+    bl_space_type = 'SEQUENCE_EDITOR'
+    bl_parent_id = "VSE_PT_composition_guides"
+
+
+class VSE_PT_guides_lines(GuidesLinesPanel, Panel):
+    bl_idname = "VSE_PT_guides_lines"
+    bl_space_type = 'SEQUENCE_EDITOR'
+    bl_parent_id = "VSE_PT_composition_guides"
+
+
+class VSE_PT_guides_composition(GuidesCompositionPanel, Panel):
+    bl_idname = "VSE_PT_guides_composition"
+    bl_space_type = 'SEQUENCE_EDITOR'
+    bl_parent_id = "VSE_PT_composition_guides"
+
+
+class VSE_PT_guides_ruler(GuidesRulerPanel, Panel):
+    bl_idname = "VSE_PT_guides_ruler"
+    bl_space_type = 'SEQUENCE_EDITOR'
+    bl_parent_id = "VSE_PT_composition_guides"
 
 
 def draw_overlay_toggle(self, context):
     """Draw toggle button in VSE preview overlay popover"""
     # Only show in SEQUENCER_PREVIEW or PREVIEW mode
-    if context.space_data.view_type not in {'PREVIEW', 'SEQUENCER_PREVIEW'}:
+    if context.space_data.view_type not in PREVIEW_VIEW_TYPES:
         return
         
     settings = context.scene.vse_guides
     
     # Check if any guides are active to determine icon
-    any_active = any([
-        settings.show_thirds,
-        settings.show_golden,
-        settings.show_center,
-        settings.show_diagonals,
-        settings.show_rulers,
-        settings.show_grid,
-        settings.show_custom_guides,
-        settings.show_golden_spiral,
-        settings.show_golden_triangle,
-        settings.show_circular_thirds,
-        settings.show_radial_symmetry,
-        settings.show_vanishing_point,
-        settings.show_diagonal_reciprocals,
-        settings.show_harmony_triangles,
-        settings.show_diagonal_method
-    ])
+    any_active = any_guides_active(settings)
     
     layout = self.layout
     layout.separator()
@@ -566,13 +413,19 @@ def draw_overlay_toggle(self, context):
     )
 
 
-def register():
-    bpy.utils.register_class(VSE_UL_custom_guides)
-    bpy.utils.register_class(VIEW3D_PT_composition_guides)
-    bpy.utils.register_class(VSE_PT_composition_guides)
-
+# Registration (parent panels before their subpanels)
+classes = (
+    VSE_UL_custom_guides,
+    VIEW3D_PT_composition_guides,
+    VIEW3D_PT_guides_grid,
+    VIEW3D_PT_guides_lines,
+    VIEW3D_PT_guides_composition,
+    VIEW3D_PT_guides_ruler,
+    VSE_PT_composition_guides,
+    VSE_PT_guides_grid,
+    VSE_PT_guides_lines,
+    VSE_PT_guides_composition,
+    VSE_PT_guides_ruler,
+)
 
-def unregister():
-    bpy.utils.unregister_class(VSE_PT_composition_guides)
-    bpy.utils.unregister_class(VIEW3D_PT_composition_guides)
-    bpy.utils.unregister_class(VSE_UL_custom_guides)
+register, unregister = bpy.utils.register_classes_factory(classes)